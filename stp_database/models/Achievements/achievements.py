@@ -1,10 +1,11 @@
 ﻿"""Модель достижения."""
 
 from datetime import datetime
+from typing import Any
 
-from sqlalchemy.dialects.mysql import LONGTEXT, VARCHAR
-from sqlalchemy import JSON, Enum, Boolean, Integer
-from sqlalchemy import BIGINT, DateTime, ForeignKey, String, Text, func
+from sqlalchemy.dialects.mysql import VARCHAR
+from sqlalchemy import JSON, Computed, Enum, Boolean, Index, Integer
+from sqlalchemy import BIGINT, DateTime, ForeignKey, String, Text, func, text
 from sqlalchemy.orm import Mapped, mapped_column
 
 from stp_database.models.base import Base
@@ -14,10 +15,17 @@ class Achievements(Base):
 
     __tablename__ = "achievements"
 
-    __table_args__ = {
-        "mysql_charset": "utf8mb4",
-        "mysql_collate": "utf8mb4_unicode_ci",
-    }
+    __table_args__ = (
+        Index("idx_period_rule_type", "period", "rule_type"),
+        # Многозначный индекс по JSON-списку направлений для фильтра JSON_CONTAINS
+        Index(
+            "idx_lookup", "period", text("(CAST(divisions AS CHAR(16) ARRAY))")
+        ),
+        {
+            "mysql_charset": "utf8mb4",
+            "mysql_collate": "utf8mb4_unicode_ci",
+        },
+    )
 
     uuid: Mapped[str] = mapped_column(
         String(250),
@@ -52,12 +60,20 @@ class Achievements(Base):
         default=1,
         comment="Награда",
     )
-    rule_expression: Mapped[str] = mapped_column(
-        LONGTEXT,
+    rule_expression: Mapped[dict] = mapped_column(
+        JSON,
         nullable=False,
-        default='{"type": "constant", "kpi": {}}',
+        default=lambda: {"type": "constant", "kpi": {}},
         comment="Требования для получения достижения",
     )
+    rule_type: Mapped[str | None] = mapped_column(
+        VARCHAR(32),
+        Computed(
+            "JSON_UNQUOTE(JSON_EXTRACT(rule_expression, '$.type'))",
+            persisted=True,
+        ),
+        comment="Тип правила получения достижения из rule_expression",
+    )
     period: Mapped[str] = mapped_column(
         Enum("daily", "weekly", "monthly", "manual"),
         nullable=False,
@@ -84,4 +100,9 @@ class Achievements(Base):
         Integer,
         nullable=True,
         comment="Когда обновлено"
-    )
\ No newline at end of file
+    )
+
+    @property
+    def rule(self) -> dict[str, Any]:
+        """Правило получения достижения в виде словаря."""
+        return self.rule_expression or {}
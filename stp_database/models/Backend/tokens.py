@@ -3,7 +3,19 @@
 from datetime import datetime
 from typing import TYPE_CHECKING
 
-from sqlalchemy import BIGINT, BOOLEAN, JSON, ForeignKey, Index, Text, Unicode, func
+from sqlalchemy import (
+    BIGINT,
+    BINARY,
+    BOOLEAN,
+    JSON,
+    Computed,
+    ForeignKey,
+    Index,
+    Text,
+    Unicode,
+    func,
+    text,
+)
 from sqlalchemy.dialects.mysql import TIMESTAMP
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 
@@ -18,7 +30,7 @@ class ApiToken(Base):
 
     Args:
         id: Уникальный идентификатор токена
-        token_hash: Хеш токена
+        token_hash: SHA-256 хеш токена (32 байта)
         employee_id: Идентификатор сотрудника-владельца
         name: Название токена
         description: Описание токена
@@ -26,6 +38,7 @@ class ApiToken(Base):
         expires_at: Дата истечения токена
         last_used_at: Дата последнего использования
         permissions: JSON с разрешениями токена
+        is_admin: Есть ли у токена admin права (вычисляется из permissions)
         created_by: Идентификатор сотрудника, создавшего токен
         created_at: Дата создания токена
 
@@ -35,17 +48,17 @@ class ApiToken(Base):
 
     __tablename__ = "tokens"
     __table_args__ = (
-        Index("idx_token_hash", "token_hash"),
-        Index("idx_employee_id", "employee_id"),
+        Index("idx_token_hash_active", "token_hash", "is_active"),
+        Index("idx_employee_active", "employee_id", "is_active", "expires_at"),
         Index("idx_expires_at", "expires_at"),
-        Index("idx_is_active", "is_active"),
+        Index("idx_admin_active", "is_admin", "is_active"),
     )
 
     id: Mapped[int] = mapped_column(
         BIGINT, primary_key=True, comment="Уникальный идентификатор токена"
     )
-    token_hash: Mapped[str] = mapped_column(
-        Unicode(64), nullable=False, unique=True, comment="Хеш токена"
+    token_hash: Mapped[bytes] = mapped_column(
+        BINARY(32), nullable=False, unique=True, comment="SHA-256 хеш токена"
     )
     employee_id: Mapped[int] = mapped_column(
         BIGINT, nullable=False, comment="Идентификатор сотрудника-владельца"
@@ -71,6 +84,14 @@ class ApiToken(Base):
     permissions: Mapped[dict] = mapped_column(
         JSON, nullable=False, default=lambda: {}, comment="JSON с разрешениями токена"
     )
+    is_admin: Mapped[bool] = mapped_column(
+        BOOLEAN,
+        Computed(
+            "IFNULL(JSON_UNQUOTE(JSON_EXTRACT(permissions, '$.admin')) = 'true', 0)",
+            persisted=True,
+        ),
+        comment="Есть ли у токена admin права",
+    )
     created_by: Mapped[int | None] = mapped_column(
         BIGINT, nullable=True, comment="Идентификатор сотрудника, создавшего токен"
     )
@@ -78,20 +99,20 @@ class ApiToken(Base):
         TIMESTAMP, server_default=func.now(), comment="Дата создания токена"
     )
 
-    # Отношения
+    # Отношения подгружаются только явно, через select_tokens("employee", ...)
     employee: Mapped["Employee"] = relationship(
         "Employee",
         primaryjoin="ApiToken.employee_id == foreign(Employee.user_id)",
-        lazy="select",
+        lazy="raise_on_sql",
     )
     creator: Mapped["Employee | None"] = relationship(
         "Employee",
         primaryjoin="ApiToken.created_by == foreign(Employee.user_id)",
         overlaps="employee",
-        lazy="select",
+        lazy="raise_on_sql",
     )
     audit_logs: Mapped[list["ApiTokenAuditLog"]] = relationship(
-        "ApiTokenAuditLog", back_populates="token", lazy="select"
+        "ApiTokenAuditLog", back_populates="token", lazy="raise_on_sql"
     )
 
     def __repr__(self):
@@ -114,16 +135,20 @@ class ApiTokenAuditLog(Base):
         metadata: Дополнительные метаданные
         created_at: Дата создания записи
 
+    Колонки user_agent, error_message и extra_metadata входят в группу
+    отложенной загрузки "cold" и подгружаются через undefer_group("cold").
+    Обращение к незагруженной колонке вызывает InvalidRequestError вместо
+    неявного SELECT.
+
     Methods:
         __repr__(): Возвращает строковое представление объекта ApiTokenAuditLog.
     """
 
     __tablename__ = "token_audit_logs"
     __table_args__ = (
-        Index("idx_token_id", "token_id"),
-        Index("idx_action", "action"),
         Index("idx_created_at", "created_at"),
-        Index("idx_token_time", "token_id", "created_at"),
+        Index("idx_token_time", "token_id", text("created_at DESC")),
+        Index("idx_action_time", "action", "created_at"),
     )
 
     id: Mapped[int] = mapped_column(
@@ -142,7 +167,12 @@ class ApiTokenAuditLog(Base):
         Unicode(45), nullable=True, comment="IP-адрес запроса"
     )
     user_agent: Mapped[str | None] = mapped_column(
-        Text, nullable=True, comment="User-Agent запроса"
+        Text,
+        nullable=True,
+        deferred=True,
+        deferred_group="cold",
+        deferred_raiseload=True,
+        comment="User-Agent запроса",
     )
     endpoint: Mapped[str | None] = mapped_column(
         Unicode(255), nullable=True, comment="Эндпоинт запроса"
@@ -154,10 +184,20 @@ class ApiTokenAuditLog(Base):
         comment="Успешность запроса",
     )
     error_message: Mapped[str | None] = mapped_column(
-        Text, nullable=True, comment="Сообщение об ошибке"
+        Text,
+        nullable=True,
+        deferred=True,
+        deferred_group="cold",
+        deferred_raiseload=True,
+        comment="Сообщение об ошибке",
     )
     extra_metadata: Mapped[dict | None] = mapped_column(
-        JSON, nullable=True, comment="Дополнительные метаданные"
+        JSON,
+        nullable=True,
+        deferred=True,
+        deferred_group="cold",
+        deferred_raiseload=True,
+        comment="Дополнительные метаданные",
     )
     created_at: Mapped[datetime] = mapped_column(
         TIMESTAMP, server_default=func.now(), comment="Дата создания записи"
@@ -165,7 +205,7 @@ class ApiTokenAuditLog(Base):
 
     # Отношения
     token: Mapped["ApiToken"] = relationship(
-        "ApiToken", back_populates="audit_logs", lazy="select"
+        "ApiToken", back_populates="audit_logs", lazy="raise_on_sql"
     )
 
     def __repr__(self):
@@ -7,7 +7,7 @@ from .exchange import Exchange, ExchangeSubscription
 from .file import File
 from .group import Group
 from .group_member import GroupMember
-from .product import Product
+from .product import Division, Product
 from .purchase import Purchase
 from .transactions import Transaction
 
@@ -20,6 +20,7 @@ __all__ = [
     "File",
     "Group",
     "GroupMember",
+    "Division",
     "Product",
     "Purchase",
     "Transaction",
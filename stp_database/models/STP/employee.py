@@ -2,7 +2,17 @@
 from datetime import date
 from typing import TYPE_CHECKING
 
-from sqlalchemy import BIGINT, BOOLEAN, INTEGER, Computed, Date, Unicode, func
+from sqlalchemy import (
+    BIGINT,
+    BINARY,
+    BOOLEAN,
+    INTEGER,
+    Computed,
+    Date,
+    Index,
+    String,
+    Unicode,
+)
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 
 from stp_database.models.base import Base
@@ -24,7 +34,7 @@ class Employee(Base):
         division: Направление сотрудника (НТП/НЦК)
         position: Позиция/должность сотрудника
         fullname: ФИО сотрудника
-        fullname_hash: хеш ФИО
+        fullname_hash: 64-битный хеш ФИО (первые 8 байт MD5)
         password_hash: хеш пароля для авторизации на портале веб приложений
         head: ФИО руководителя сотрудника
         email: Email сотрудника
@@ -37,11 +47,28 @@ class Employee(Base):
         totp_requires: bool подключена ли двухфакторка или нет, если нет - нужно просить настроить
         totp_secret: секрет для валидации генерируевых кодов
 
+    По fullname построен полнотекстовый индекс idx_fullname_ft с парсером ngram
+    для поиска по любой подстроке частей ФИО.
+
     Methods:
         __repr__(): Возвращает строковое представление объекта Employee.
     """
 
     __tablename__ = "employees"
+    __table_args__ = (
+        Index("idx_user_id", "user_id", unique=True),
+        Index("idx_username", "username"),
+        Index("idx_fullname_hash", "fullname_hash"),
+        Index("idx_active_emps", "access", "on_vacation", "division"),
+        Index("idx_role", "role"),
+        Index("idx_head_fullname", "head", "fullname"),
+        Index(
+            "idx_fullname_ft",
+            "fullname",
+            mysql_prefix="FULLTEXT",
+            mysql_with_parser="ngram",
+        ),
+    )
 
     id: Mapped[int] = mapped_column(
         BIGINT, primary_key=True, comment="Уникальный идентификатор пользователя"
@@ -53,41 +80,41 @@ class Employee(Base):
         BIGINT, nullable=True, comment="Идентификатор сотрудника в Telegram"
     )
     username: Mapped[str] = mapped_column(
-        Unicode,nullable=True, comment="Username сотрудника в Telegram"
+        Unicode(32), nullable=True, comment="Username сотрудника в Telegram"
     )
     login: Mapped[str] = mapped_column(
-        Unicode,
+        Unicode(64),
         default=None,
         unique=True,
         nullable=True,
         comment="Логин сотрудника"
     )
     division: Mapped[str] = mapped_column(
-        Unicode, nullable=True, comment="Направление сотрудника (НТП/НЦК)"
+        Unicode(16), nullable=True, comment="Направление сотрудника (НТП/НЦК)"
     )
     position: Mapped[str] = mapped_column(
-        Unicode, nullable=True, comment="Позиция/должность сотрудника"
+        Unicode(128), nullable=True, comment="Позиция/должность сотрудника"
     )
     fullname: Mapped[str] = mapped_column(
-        Unicode, nullable=False, comment="ФИО сотрудника"
+        Unicode(128), nullable=False, comment="ФИО сотрудника"
     )
-    fullname_hash: Mapped[str] = mapped_column(
-        Unicode(64),
-        Computed(func.sha2("fullname", 256), persisted=True),
+    fullname_hash: Mapped[bytes] = mapped_column(
+        BINARY(8),
+        Computed("UNHEX(LEFT(MD5(fullname), 16))", persisted=True),
         nullable=False,
         comment="Хеш ФИО сотрудника",
     )
     password_hash: Mapped[str] = mapped_column(
-        Unicode,
+        String(255, collation="ascii_bin"),
         default=None,
         nullable=True,
         comment="Пароль сотрудника"
     )
     head: Mapped[str] = mapped_column(
-        Unicode, nullable=True, comment="ФИО руководителя сотрудника"
+        Unicode(128), nullable=True, comment="ФИО руководителя сотрудника"
     )
     email: Mapped[str] = mapped_column(
-        Unicode, nullable=True, comment="Email сотрудника"
+        Unicode(254), nullable=True, comment="Email сотрудника"
     )
     employment_date: Mapped[date | None] = mapped_column(
         Date,
@@ -142,39 +169,39 @@ class Employee(Base):
         comment="Подключена ли двухфакторка"
     )
     totp_secret: Mapped[str] = mapped_column(
-        Unicode,
+        String(64, collation="ascii_bin"),
         nullable=True,
         default=None,
         comment="Секрет двухфакторки"
     )
 
-    # Отношения
+    # Отношения подгружаются только явно, через параметр load методов EmployeeRepo
     event_logs: Mapped[list["EventLog"]] = relationship(
-        "EventLog", back_populates="employee", lazy="select"
+        "EventLog", back_populates="employee", lazy="raise_on_sql"
     )
     owned_exchanges: Mapped[list["Exchange"]] = relationship(
         "Exchange",
         primaryjoin="Employee.user_id == foreign(Exchange.owner_id)",
         back_populates="owner",
-        lazy="select",
+        lazy="raise_on_sql",
     )
     counterpart_exchanges: Mapped[list["Exchange"]] = relationship(
         "Exchange",
         primaryjoin="Employee.user_id == foreign(Exchange.counterpart_id)",
         back_populates="counterpart",
-        lazy="select",
+        lazy="raise_on_sql",
     )
     exchange_subscriptions: Mapped[list["ExchangeSubscription"]] = relationship(
         "ExchangeSubscription",
         primaryjoin="Employee.user_id == foreign(ExchangeSubscription.subscriber_id)",
         back_populates="subscriber",
-        lazy="select",
+        lazy="raise_on_sql",
     )
     target_subscriptions: Mapped[list["ExchangeSubscription"]] = relationship(
         "ExchangeSubscription",
         primaryjoin="Employee.user_id == foreign(ExchangeSubscription.target_seller_id)",
         back_populates="target_seller",
-        lazy="select",
+        lazy="raise_on_sql",
     )
 
     def __repr__(self):
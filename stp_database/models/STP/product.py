@@ -1,11 +1,77 @@
 """Модели, связанные с сущностями предметов."""
 
-from sqlalchemy import JSON, Boolean, Integer
-from sqlalchemy.dialects.mysql import VARCHAR
-from sqlalchemy.orm import Mapped, mapped_column
+from enum import IntEnum
+
+from sqlalchemy import JSON, Boolean, Index, Integer, SmallInteger, TypeDecorator
+from sqlalchemy.dialects.mysql import TINYINT, VARCHAR
+from sqlalchemy.orm import Mapped, mapped_column, validates
 
 from stp_database.models.base import Base
 
+ALL_DAYS_MASK = 0x7F
+
+
+class Division(IntEnum):
+    """Направление, хранимое в БД в виде TINYINT."""
+
+    NTP = 1
+    NCK = 2
+
+    @property
+    def label(self) -> str:
+        """Название направления (НТП/НЦК)."""
+        return DIVISION_LABELS[self]
+
+
+DIVISION_LABELS = {Division.NTP: "НТП", Division.NCK: "НЦК"}
+_DIVISIONS_BY_LABEL = {label: division for division, label in DIVISION_LABELS.items()}
+
+
+def normalize_division(division: str | None) -> str | None:
+    """Нормализация подразделения сотрудника до направления предмета.
+
+    Подразделения НТП1, НТП2 и т.д. относятся к направлению НТП.
+
+    Args:
+        division: Подразделение для нормализации
+
+    Returns:
+        Нормализованное подразделение
+    """
+    if division and division.startswith("НТП"):
+        return "НТП"
+    return division
+
+
+class DivisionType(TypeDecorator):
+    """Направление, хранимое как TINYINT.
+
+    В Python значение остается строкой (НТП/НЦК), поэтому фильтры вида
+    Product.division == "НТП" продолжают работать. Также принимается Division.
+    Другие значения, в том числе подразделения (НТП1, НТП2), не принимаются:
+    их нужно явно привести к направлению через normalize_division.
+    """
+
+    impl = TINYINT
+    cache_ok = True
+
+    def process_bind_param(self, value: str | int | None, dialect) -> int | None:
+        """Преобразование названия направления в номер перед сохранением."""
+        if value is None:
+            return None
+        if isinstance(value, int):
+            return int(Division(value))
+        try:
+            return int(_DIVISIONS_BY_LABEL[value])
+        except KeyError:
+            raise ValueError(f"Неизвестное направление: {value}") from None
+
+    def process_result_value(self, value: int | None, dialect) -> str | None:
+        """Преобразование номера направления в название при загрузке."""
+        if value is None:
+            return None
+        return DIVISION_LABELS[Division(value)]
+
 
 class Product(Base):
     """Класс, представляющий сущность предмета в БД.
@@ -18,6 +84,7 @@ class Product(Base):
         cost: Стоимость предмета в магазине
         count: Кол-во использований предмета
         activate_days: Дни доступности активации предмета
+        activate_days_mask: Битовая маска дней недели активации (бит day-1 для дня 1-7)
         buyer_roles: Роли для покупки предмета
         manager_role: Роль для подтверждения активации предмета
 
@@ -26,6 +93,7 @@ class Product(Base):
     """
 
     __tablename__ = "products"
+    __table_args__ = (Index("idx_products_active", "division", "active", "cost"),)
 
     id: Mapped[int] = mapped_column(
         Integer,
@@ -40,7 +108,7 @@ class Product(Base):
         VARCHAR(255), nullable=False, comment="Описание предмета"
     )
     division: Mapped[str] = mapped_column(
-        VARCHAR(3),
+        DivisionType,
         nullable=False,
         comment="Направление (НТП/НЦК) доступности приобретения предмета",
     )
@@ -53,6 +121,12 @@ class Product(Base):
     activate_days: Mapped[list] = mapped_column(
         JSON, nullable=True, comment="Дни доступности активации предмета"
     )
+    activate_days_mask: Mapped[int] = mapped_column(
+        SmallInteger,
+        nullable=False,
+        default=ALL_DAYS_MASK,
+        comment="Битовая маска дней недели доступности активации предмета",
+    )
     buyer_roles: Mapped[list] = mapped_column(
         JSON, nullable=True, comment="Роли с доступом к предмету"
     )
@@ -66,6 +140,39 @@ class Product(Base):
         default=1,
     )
 
+    @validates("activate_days")
+    def _sync_activate_days_mask(self, key: str, days: list[int] | None) -> list[int] | None:
+        """Синхронизация activate_days_mask при изменении activate_days.
+
+        Пустой список или None означает, что активация доступна в любой день.
+
+        Raises:
+            ValueError: Если день недели вне диапазона 1-7
+        """
+        if not days:
+            self.activate_days_mask = ALL_DAYS_MASK
+            return days
+
+        mask = 0
+        for day in days:
+            if not 1 <= day <= 7:
+                raise ValueError(f"День недели должен быть в диапазоне 1-7: {day}")
+            mask |= 1 << (day - 1)
+
+        self.activate_days_mask = mask
+        return days
+
+    def is_activation_day(self, day: int) -> bool:
+        """Проверка доступности активации предмета в день недели.
+
+        Args:
+            day: День недели от 1 (понедельник) до 7 (воскресенье)
+
+        Returns:
+            True если активация доступна, иначе False
+        """
+        return bool(self.activate_days_mask & (1 << (day - 1)))
+
     def __repr__(self):
         """Возвращает строковое представление объекта Product."""
         return f"<Product {self.id} {self.name} {self.description} {self.division} {self.cost} {self.count} {self.manager_role}>"
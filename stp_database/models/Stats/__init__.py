@@ -2,17 +2,19 @@
 
 from .head_premium import HeadPremium
 from .sl import SL
-from .spec_kpi import SpecDayKPI, SpecMonthKPI, SpecWeekKPI
-from .spec_premium import SpecPremium
+from .spec_kpi import SpecDayKPI, SpecKPI, SpecMonthKPI, SpecWeekKPI
+from .spec_premium import SpecPremium, SpecPremiumSummary
 from .tests import AssignedTest
 from .tutors_schedule import TutorsSchedule
 
 __all__ = [
     "HeadPremium",
     "SpecDayKPI",
+    "SpecKPI",
     "SpecMonthKPI",
     "SpecWeekKPI",
     "SpecPremium",
+    "SpecPremiumSummary",
     "SL",
     "AssignedTest",
     "TutorsSchedule",
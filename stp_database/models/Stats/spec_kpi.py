@@ -2,20 +2,59 @@
 
 from datetime import datetime
 
-from sqlalchemy import DateTime, Float, Integer
+from sqlalchemy import DDL, JSON, DateTime, Enum, Float, Integer, event, func
+from sqlalchemy.ext.hybrid import hybrid_property
 from sqlalchemy.orm import Mapped, mapped_column
 
 from stp_database.models.base import Base
 
 
+def _metric(key: str, doc: str) -> hybrid_property:
+    """Создание атрибута-обертки над ключом JSON колонки metrics.
+
+    Args:
+        key: Ключ показателя в metrics
+        doc: Описание показателя
+
+    Returns:
+        hybrid_property, читающий и записывающий metrics[key] на экземпляре
+        и JSON_EXTRACT(metrics, '$.key') в SQL выражениях
+    """
+
+    def getter(self) -> int | None:
+        return (self.metrics or {}).get(key)
+
+    def setter(self, value: int | None) -> None:
+        # Переприсваиваем словарь целиком, чтобы SQLAlchemy увидел изменение JSON
+        self.metrics = {**(self.metrics or {}), key: value}
+
+    def expression(cls):
+        return func.json_extract(cls.metrics, f"$.{key}")
+
+    prop = hybrid_property(getter, setter, expr=expression)
+    prop.__doc__ = doc
+    return prop
+
+
 class SpecKPI(Base):
     """Универсальная модель, представляющая сущность показателей специалиста день, неделю или месяц.
 
-    Может работать с разными таблицами: KpiDay, KpiWeek, KpiMonth.
-    Таблица указывается динамически через __table_args__ или при создании мапера.
+    Показатели за все периоды хранятся в одной таблице kpi, период задается
+    колонкой period. Модели SpecDayKPI, SpecWeekKPI и SpecMonthKPI отображаются
+    на ту же таблицу (single table inheritance) и автоматически фильтруют
+    строки по своему периоду. Запрос по SpecKPI возвращает показатели всех периодов.
+
+    Для совместимости с внешними читателями создаются представления
+    KpiDay, KpiWeek и KpiMonth.
+
+    Таблица секционирована по RANGE(TO_DAYS(extraction_period)) помесячно.
+    Изначально создается одна секция p_max, новые месяцы выделяются из нее
+    через SpecKPIRepo.add_month_partition, старые удаляются через
+    SpecKPIRepo.drop_partitions_before.
 
     Args:
-        fullname: ФИО специалиста
+        employee_id: Идентификатор сотрудника на OKC
+        period: Период показателей (day, week или month)
         contacts_count: Кол-во контактов специалиста
 
         csat: Значение показателя CSAT за период
@@ -32,6 +71,10 @@ class SpecKPI(Base):
         paid_service_count: Платный сервис реальный
         paid_service_conversion: Конверсия платного сервиса
 
+        metrics: JSON с редко используемыми детализирующими показателями
+            (каналы AHT, детализация FLR, продаж и платного сервиса и т.д.),
+            доступными как обычные атрибуты модели
+
         extraction_period: Дата, с которой производилась выгрузка показателей
         updated_at: Дата выгрузки показателей в БД
 
@@ -39,8 +82,12 @@ class SpecKPI(Base):
         __repr__(): Возвращает строковое представление объекта SpecKPI.
     """
 
-    __tablename__ = None  # Будет установлено динамически
-    __abstract__ = True  # Абстрактная модель
+    __tablename__ = "kpi"
+    __table_args__ = {
+        "mysql_partition_by": "RANGE (TO_DAYS(extraction_period)) "
+        "(PARTITION p_max VALUES LESS THAN MAXVALUE)",
+    }
+    __mapper_args__ = {"polymorphic_on": "period"}
 
     employee_id: Mapped[int] = mapped_column(
         Integer,
@@ -48,6 +95,12 @@ class SpecKPI(Base):
         primary_key=True,
         comment="Идентификатор сотрудника на OKC",
     )
+    period: Mapped[str] = mapped_column(
+        Enum("day", "week", "month"),
+        nullable=False,
+        primary_key=True,
+        comment="Период показателей: день, неделя или месяц",
+    )
     contacts_count: Mapped[int | None] = mapped_column(
         Integer, nullable=True, comment="Кол-во контактов специалиста за период"
     )
@@ -56,49 +109,16 @@ class SpecKPI(Base):
     csat: Mapped[float | None] = mapped_column(
         Float, nullable=True, comment="Значение показатели CSAT за период"
     )
-    csat_rated: Mapped[int | None] = mapped_column(
-        Integer, nullable=True, comment="Количество оцененных чатов в Генезис"
-    )
-    csat_high_rated: Mapped[int | None] = mapped_column(
-        Integer, nullable=True, comment="Количество высоко оцененных чатов в Генезис"
-    )
 
     # Колонки, связанные с AHT
     aht: Mapped[int | None] = mapped_column(
         Integer, nullable=True, comment="Значение показателя AHT за период"
     )
-    aht_chats_mobile: Mapped[int | None] = mapped_column(
-        Integer, nullable=True, comment="Кол-во контактов из приложения за период"
-    )
-    aht_chats_web: Mapped[int | None] = mapped_column(
-        Integer, nullable=True, comment="Кол-во контактов из сайта за период"
-    )
-    aht_chats_smartdom: Mapped[int | None] = mapped_column(
-        Integer, nullable=True, comment="Кол-во контактов из МП УДР за период"
-    )
-    aht_chats_dhcp: Mapped[int | None] = mapped_column(
-        Integer, nullable=True, comment="Кол-во контактов из портала за период"
-    )
-    aht_chats_telegram: Mapped[int | None] = mapped_column(
-        Integer, nullable=True, comment="Кол-во контактов из Telegram за период"
-    )
-    aht_chats_viber: Mapped[int | None] = mapped_column(
-        Integer, nullable=True, comment="Кол-во контактов из Viber за период"
-    )
 
     # Колонки, связанные с FLR
     flr: Mapped[float | None] = mapped_column(
         Float, nullable=True, comment="Значение показателя FLR за период"
     )
-    flr_services: Mapped[int | None] = mapped_column(
-        Integer, nullable=True, comment="Кол-во сервисных заявок за период"
-    )
-    flr_services_cross: Mapped[int | None] = mapped_column(
-        Integer, nullable=True, comment="Кол-во сквозных обращений за период"
-    )
-    flr_services_transfer: Mapped[int | None] = mapped_column(
-        Integer, nullable=True, comment="Кол-во переведенных обращений за период"
-    )
 
     # Колонки, связанные с CSI
     csi: Mapped[float | None] = mapped_column(
@@ -111,9 +131,6 @@ class SpecKPI(Base):
         nullable=True,
         comment="Значение показателя отклика за период",
     )
-    pok_rated_contacts: Mapped[int | None] = mapped_column(
-        Integer, nullable=True, comment="Кол-во оцененных чатов за период"
-    )
 
     # Колонки, связанные с Delay
     delay: Mapped[float | None] = mapped_column(
@@ -128,26 +145,6 @@ class SpecKPI(Base):
         nullable=True,
         comment="Кол-во реальных продаж за период",
     )
-    sales_videos: Mapped[int | None] = mapped_column(
-        Integer,
-        nullable=True,
-        comment="Кол-во реальных продаж видеокамер за период",
-    )
-    sales_routers: Mapped[int | None] = mapped_column(
-        Integer,
-        nullable=True,
-        comment="Кол-во реальных продаж роутеров за период",
-    )
-    sales_tvs: Mapped[int | None] = mapped_column(
-        Integer,
-        nullable=True,
-        comment="Кол-во реальных продаж приставок за период",
-    )
-    sales_intercoms: Mapped[int | None] = mapped_column(
-        Integer,
-        nullable=True,
-        comment="Кол-во реальных продаж домофонов за период",
-    )
     sales_conversion: Mapped[float | None] = mapped_column(
         Float,
         nullable=True,
@@ -160,31 +157,6 @@ class SpecKPI(Base):
         nullable=True,
         comment="Кол-во потенциальных продаж за период",
     )
-    sales_potential_video: Mapped[int | None] = mapped_column(
-        Integer,
-        nullable=True,
-        comment="Кол-во потенциальных продаж видеокамер за период",
-    )
-    sales_potential_routers: Mapped[int | None] = mapped_column(
-        Integer,
-        nullable=True,
-        comment="Кол-во потенциальных продаж роутеров за период",
-    )
-    sales_potential_tvs: Mapped[int | None] = mapped_column(
-        Integer,
-        nullable=True,
-        comment="Кол-во потенциальных продаж приставок за период",
-    )
-    sales_potential_intercoms: Mapped[int | None] = mapped_column(
-        Integer,
-        nullable=True,
-        comment="Кол-во потенциальных продаж домофонов за период",
-    )
-    sales_potential_conversion: Mapped[int | None] = mapped_column(
-        Integer,
-        nullable=True,
-        comment="Конверсия потенциальных продаж за период",
-    )
 
     # Колонки, связанные с платным сервисом
     services: Mapped[int | None] = mapped_column(
@@ -192,16 +164,6 @@ class SpecKPI(Base):
         nullable=True,
         comment="Кол-во заявок на платный сервис за период",
     )
-    services_remote: Mapped[int | None] = mapped_column(
-        Integer,
-        nullable=True,
-        comment="Кол-во заявок на удаленный платный сервис за период",
-    )
-    services_onsite: Mapped[int | None] = mapped_column(
-        Integer,
-        nullable=True,
-        comment="Кол-во заявок на выездной платный сервис за период",
-    )
     services_conversion: Mapped[float | None] = mapped_column(
         Float,
         nullable=True,
@@ -212,6 +174,50 @@ class SpecKPI(Base):
         Integer, nullable=True, default=0, comment="Кол-во благодарностей за период"
     )
 
+    metrics: Mapped[dict] = mapped_column(
+        JSON,
+        nullable=False,
+        default=dict,
+        comment="Детализирующие показатели за период",
+    )
+
+    # Детализация, связанная с CSAT
+    csat_rated = _metric("csat_rated", "Количество оцененных чатов в Генезис")
+    csat_high_rated = _metric("csat_high_rated", "Количество высоко оцененных чатов в Генезис")
+
+    # Детализация, связанная с AHT
+    aht_chats_mobile = _metric("aht_chats_mobile", "Кол-во контактов из приложения за период")
+    aht_chats_web = _metric("aht_chats_web", "Кол-во контактов из сайта за период")
+    aht_chats_smartdom = _metric("aht_chats_smartdom", "Кол-во контактов из МП УДР за период")
+    aht_chats_dhcp = _metric("aht_chats_dhcp", "Кол-во контактов из портала за период")
+    aht_chats_telegram = _metric("aht_chats_telegram", "Кол-во контактов из Telegram за период")
+    aht_chats_viber = _metric("aht_chats_viber", "Кол-во контактов из Viber за период")
+
+    # Детализация, связанная с FLR
+    flr_services = _metric("flr_services", "Кол-во сервисных заявок за период")
+    flr_services_cross = _metric("flr_services_cross", "Кол-во сквозных обращений за период")
+    flr_services_transfer = _metric("flr_services_transfer", "Кол-во переведенных обращений за период")
+
+    # Детализация, связанная с POK
+    pok_rated_contacts = _metric("pok_rated_contacts", "Кол-во оцененных чатов за период")
+
+    # Детализация, связанная с реальными продажами
+    sales_videos = _metric("sales_videos", "Кол-во реальных продаж видеокамер за период")
+    sales_routers = _metric("sales_routers", "Кол-во реальных продаж роутеров за период")
+    sales_tvs = _metric("sales_tvs", "Кол-во реальных продаж приставок за период")
+    sales_intercoms = _metric("sales_intercoms", "Кол-во реальных продаж домофонов за период")
+
+    # Детализация, связанная с потенциальными продажами
+    sales_potential_video = _metric("sales_potential_video", "Кол-во потенциальных продаж видеокамер за период")
+    sales_potential_routers = _metric("sales_potential_routers", "Кол-во потенциальных продаж роутеров за период")
+    sales_potential_tvs = _metric("sales_potential_tvs", "Кол-во потенциальных продаж приставок за период")
+    sales_potential_intercoms = _metric("sales_potential_intercoms", "Кол-во потенциальных продаж домофонов за период")
+    sales_potential_conversion = _metric("sales_potential_conversion", "Конверсия потенциальных продаж за период")
+
+    # Детализация, связанная с платным сервисом
+    services_remote = _metric("services_remote", "Кол-во заявок на удаленный платный сервис за период")
+    services_onsite = _metric("services_onsite", "Кол-во заявок на выездной платный сервис за период")
+
     extraction_period: Mapped[datetime | None] = mapped_column(
         DateTime,
         nullable=True,
@@ -227,24 +233,37 @@ class SpecKPI(Base):
 
     def __repr__(self) -> str:
         """Возвращает строковое представление объекта SpecKPI."""
-        table = self.__tablename__
-        return f"<SpecKPI[{table}] employee_id={self.employee_id} contacts_count={self.contacts_count} extraction_period={self.extraction_period} updated_at={self.updated_at}>"
+        return f"<SpecKPI[{self.period}] employee_id={self.employee_id} contacts_count={self.contacts_count} extraction_period={self.extraction_period} updated_at={self.updated_at}>"
 
 
-# Конкретные модели для каждой таблицы
+# Модели для каждого периода в общей таблице kpi
 class SpecDayKPI(SpecKPI):
     """Модель показателей специалиста за день."""
 
-    __tablename__ = "KpiDay"
+    __mapper_args__ = {"polymorphic_identity": "day"}
 
 
 class SpecWeekKPI(SpecKPI):
     """Модель показателей специалиста за неделю."""
 
-    __tablename__ = "KpiWeek"
+    __mapper_args__ = {"polymorphic_identity": "week"}
 
 
 class SpecMonthKPI(SpecKPI):
     """Модель показателей специалиста за месяц."""
 
-    __tablename__ = "KpiMonth"
+    __mapper_args__ = {"polymorphic_identity": "month"}
+
+
+# Представления с прежними названиями таблиц для внешних читателей
+for _view, _period in (("KpiDay", "day"), ("KpiWeek", "week"), ("KpiMonth", "month")):
+    event.listen(
+        SpecKPI.__table__,
+        "after_create",
+        DDL(f"CREATE OR REPLACE VIEW `{_view}` AS SELECT * FROM kpi WHERE period = '{_period}'"),
+    )
+    event.listen(
+        SpecKPI.__table__,
+        "before_drop",
+        DDL(f"DROP VIEW IF EXISTS `{_view}`"),
+    )
@@ -2,7 +2,7 @@
 
 from datetime import datetime
 
-from sqlalchemy import DateTime, Float, Integer
+from sqlalchemy import DateTime, Float, Integer, func
 from sqlalchemy.orm import Mapped, mapped_column
 
 from stp_database.models.base import Base
@@ -11,6 +11,10 @@ from stp_database.models.base import Base
 class SpecPremium(Base):
     """Модель, представляющая сущность премии специалиста за месяц в БД.
 
+    Таблица секционирована по RANGE(TO_DAYS(extraction_period)) помесячно.
+    Секции создаются через SpecPremiumRepo.add_month_partition и удаляются
+    через SpecPremiumRepo.drop_partitions_before.
+
     Args:
         employee_id: Идентификатор сотрудника на OKC
         contacts_count: Кол-во контактов специалиста
@@ -42,6 +46,10 @@ class SpecPremium(Base):
     """
 
     __tablename__ = "SpecPremium"
+    __table_args__ = {
+        "mysql_partition_by": "RANGE (TO_DAYS(extraction_period)) "
+        "(PARTITION p_max VALUES LESS THAN MAXVALUE)",
+    }
 
     employee_id: Mapped[int] = mapped_column(
         Integer,
@@ -114,3 +122,61 @@ class SpecPremium(Base):
     def __repr__(self):
         """Возвращает строковое представление объекта SpecPremium."""
         return f"<SpecPremium employee_id={self.employee_id} contacts_count={self.contacts_count} total_premium={self.total_premium} updated_at={self.updated_at}>"
+
+
+class SpecPremiumSummary(Base):
+    """Модель, представляющая сводку премии специалистов за месяц в БД.
+
+    Заполняется из SpecPremium через SpecPremiumRepo.refresh_summary после
+    загрузки премии за период, чтобы дашборды читали одну строку вместо
+    всех строк премии за период.
+
+    Args:
+        extraction_period: Дата, с которой производилась выгрузка премии
+        employees_count: Кол-во специалистов с премией за период
+        contacts_count: Суммарное кол-во контактов специалистов
+        aht_premium: Средний процент премии за AHT
+        csat_premium: Средний процент премии за CSAT
+        gok_premium: Средний процент премии за ГОК
+        total_premium: Средний общий процент премии
+        updated_at: Дата пересчета сводки
+
+    Methods:
+        __repr__(): Возвращает строковое представление объекта SpecPremiumSummary.
+    """
+
+    __tablename__ = "SpecPremiumSummary"
+
+    extraction_period: Mapped[datetime] = mapped_column(
+        DateTime,
+        primary_key=True,
+        comment="Дата, с которой производилась выгрузка премии",
+    )
+    employees_count: Mapped[int] = mapped_column(
+        Integer, nullable=False, comment="Кол-во специалистов с премией за период"
+    )
+    contacts_count: Mapped[int | None] = mapped_column(
+        Integer, nullable=True, comment="Суммарное кол-во контактов специалистов"
+    )
+    aht_premium: Mapped[float | None] = mapped_column(
+        Float, nullable=True, comment="Средний процент премии за AHT"
+    )
+    csat_premium: Mapped[float | None] = mapped_column(
+        Float, nullable=True, comment="Средний процент премии за CSAT"
+    )
+    gok_premium: Mapped[float | None] = mapped_column(
+        Float, nullable=True, comment="Средний процент премии за ГОК"
+    )
+    total_premium: Mapped[float | None] = mapped_column(
+        Float, nullable=True, comment="Средний общий процент премии"
+    )
+    updated_at: Mapped[datetime] = mapped_column(
+        DateTime,
+        nullable=False,
+        server_default=func.now(),
+        comment="Дата пересчета сводки",
+    )
+
+    def __repr__(self):
+        """Возвращает строковое представление объекта SpecPremiumSummary."""
+        return f"<SpecPremiumSummary extraction_period={self.extraction_period} employees_count={self.employees_count} total_premium={self.total_premium}>"
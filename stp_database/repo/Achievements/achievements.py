@@ -1,47 +1,112 @@
 ﻿"""Репозиторий по работе со списком достижений."""
 
+import json
 import logging
-from typing import Any, Sequence
+from typing import Any, Mapping, Sequence
 from datetime import datetime
-from typing import Sequence
 
-from sqlalchemy import or_, delete, select
+from sqlalchemy import bindparam, func, or_, delete, insert, select, update
 from sqlalchemy.exc import SQLAlchemyError
+from sqlalchemy.ext.asyncio import AsyncSession
 
 from stp_database.models.Achievements import Achievements
 from stp_database.repo.base import BaseRepo
+from stp_database.repo.cache import CatalogCache
 
 logger = logging.getLogger(__name__)
 
+# Базовые запросы строятся один раз при импорте модуля,
+# параметры передаются при выполнении
+_ALL_STMT = select(Achievements).order_by(Achievements.created_at.desc())
+_BY_PERIOD_STMT = _ALL_STMT.where(Achievements.period == bindparam("period"))
+
 
 class AchievementsRepo(BaseRepo):
-    """Репозиторий для работы со списком достижений."""
+    """Репозиторий для работы со списком достижений.
+
+    Attributes:
+        cache: Кеш справочника достижений (опционально)
+    """
+
+    def __init__(self, session, cache: CatalogCache | None = None):
+        """Инициализация репозитория.
+
+        Args:
+            session: Сессия SQLAlchemy
+            cache: Кеш справочника достижений (опционально)
+        """
+        super().__init__(session)
+        self.cache = cache
+
+    async def _fetch_achievements(
+            self, key, stmt, params: dict[str, Any] | None = None
+    ) -> Sequence[Achievements]:
+        """Выполнение запроса к достижениям с использованием кеша.
+
+        Закешированные достижения загружаются в отдельной сессии кеша,
+        отсоединены от нее и доступны только для чтения.
+        """
+
+        async def load(session: AsyncSession) -> Sequence[Achievements]:
+            result = await session.execute(stmt, params)
+            return result.scalars().all()
+
+        if self.cache is None:
+            return await load(self.session)
+        return await self.cache.get_or_load(key, load)
+
+    async def _invalidate_cache(self) -> None:
+        """Инвалидация кеша достижений после изменения справочника."""
+        if self.cache is not None:
+            await self.cache.bump()
 
     async def get_achievements_by_period(
         self,
         period: str,
+        division: str | None = None,
+        position: str | None = None,
+        rule_type: str | None = None,
     ) -> Sequence[Achievements]:
-        """Получить достижения для заданного периода."""
-        stmt = (
-            select(Achievements)
-            .where(Achievements.period == period)
-            .order_by(Achievements.created_at.desc())
-        )
+        """Получить достижения для заданного периода.
 
-        result = await self.session.execute(stmt)
-        return result.scalars().all()
+        Фильтры по направлению, должности и типу правила применяются в БД,
+        чтобы не загружать и не перебирать все достижения периода в Python.
 
-    async def get_achievements(self) -> Sequence[Achievements]:
-        """Получить список всех достижений."""
+        Args:
+            period: Частота получения достижения
+            division: Направление, которому доступно достижение (опционально)
+            position: Должность, которой доступно достижение (опционально)
+            rule_type: Тип правила из rule_expression (опционально)
 
-        stmt = (
-            select(Achievements)
-            .order_by(Achievements.created_at.desc())
-        )
+        Returns:
+            Список достижений, отсортированный по created_at DESC
+        """
+        conditions = []
+
+        if rule_type is not None:
+            conditions.append(Achievements.rule_type == rule_type)
+        if division is not None:
+            conditions.append(
+                func.json_contains(
+                    Achievements.divisions, json.dumps(division, ensure_ascii=False)
+                )
+            )
+        if position is not None:
+            conditions.append(
+                func.json_contains(
+                    Achievements.positions, json.dumps(position, ensure_ascii=False)
+                )
+            )
+
+        stmt = _BY_PERIOD_STMT.where(*conditions) if conditions else _BY_PERIOD_STMT
+
+        key = ("by_period", period, division, position, rule_type)
+        return await self._fetch_achievements(key, stmt, {"period": period})
 
-        result = await self.session.execute(stmt)
+    async def get_achievements(self) -> Sequence[Achievements]:
+        """Получить список всех достижений."""
 
-        return result.scalars().all()
+        return await self._fetch_achievements(("all",), _ALL_STMT)
 
     async def get_achievement_by_uuid(
             self,
@@ -57,13 +122,7 @@ class AchievementsRepo(BaseRepo):
             Достижение или None, если запись не найдена.
         """
 
-        stmt = select(Achievements).where(
-            Achievements.uuid == achievement_uuid
-        )
-
-        result = await self.session.execute(stmt)
-
-        return result.scalar_one_or_none()
+        return await self.session.get(Achievements, achievement_uuid)
 
     async def create_achievement(
             self,
@@ -74,9 +133,12 @@ class AchievementsRepo(BaseRepo):
             positions: list[str] | None = None,
             period: str | None = None,
             reward: int | None = None,
-            rule_expression: str | None = None,
+            rule_expression: dict | str | None = None,
             created_by: int | None = None,
     ) -> None:
+        if isinstance(rule_expression, str):
+            rule_expression = json.loads(rule_expression)
+
         achievement = Achievements(
             uuid=uuid,
             name=name,
@@ -90,15 +152,81 @@ class AchievementsRepo(BaseRepo):
         )
 
         try:
-            self.session.add(achievement)
-            await self.session.commit()
+            async with self._tx():
+                self.session.add(achievement)
             await self.session.refresh(achievement)
-            return achievement
         except SQLAlchemyError as e:
             logger.error(f"[БД] Ошибка создания достижения: {e}")
-            await self.session.rollback()
             return None
 
+        await self._after_commit(self._invalidate_cache)
+        return achievement
+
+    async def create_achievements_bulk(
+            self,
+            rows: Sequence[Mapping[str, Any]],
+    ) -> list[str]:
+        """
+        Создать несколько достижений одним INSERT.
+
+        Строки вставляются многострочным INSERT в одной транзакции вместо
+        отдельного коммита на каждое достижение.
+
+        Args:
+            rows: Достижения в виде словарей с полями create_achievement.
+
+        Returns:
+            Список UUID созданных достижений.
+
+        Raises:
+            ValueError: Если в строке передано недопустимое поле или не передан uuid.
+        """
+
+        if not rows:
+            return []
+
+        allowed_fields = {
+            "uuid",
+            "name",
+            "description",
+            "divisions",
+            "positions",
+            "period",
+            "reward",
+            "rule_expression",
+            "created_by",
+        }
+
+        values = []
+        for row in rows:
+            invalid_fields = set(row) - allowed_fields
+            if invalid_fields:
+                raise ValueError(
+                    "Недопустимые поля достижения: "
+                    + ", ".join(sorted(invalid_fields))
+                )
+            if not row.get("uuid"):
+                raise ValueError("Не передан uuid достижения")
+
+            value = dict(row)
+            if isinstance(value.get("rule_expression"), str):
+                value["rule_expression"] = json.loads(value["rule_expression"])
+            values.append(value)
+
+        try:
+            async with self._tx():
+                await self.session.execute(insert(Achievements), values)
+
+        except SQLAlchemyError:
+            logger.exception(
+                "[БД] Ошибка создания %s достижений",
+                len(values),
+            )
+            raise
+
+        await self._after_commit(self._invalidate_cache)
+        return [value["uuid"] for value in values]
+
     async def update_achievement(
             self,
             achievement_uuid: str,
@@ -141,34 +269,35 @@ class AchievementsRepo(BaseRepo):
                 + ", ".join(sorted(invalid_fields))
             )
 
-        stmt = select(Achievements).where(
-            Achievements.uuid == achievement_uuid
-        )
-
-        result = await self.session.execute(stmt)
-        achievement = result.scalar_one_or_none()
-
-        if achievement is None:
-            return None
-
-        for field, value in changes.items():
-            setattr(achievement, field, value)
+        if isinstance(changes.get("rule_expression"), str):
+            changes["rule_expression"] = json.loads(changes["rule_expression"])
 
-        achievement.updated_at = datetime.now()
+        stmt = (
+            update(Achievements)
+            .where(Achievements.uuid == achievement_uuid)
+            .values(**changes, updated_at=datetime.now())
+            .execution_options(synchronize_session=False)
+        )
 
         try:
-            await self.session.commit()
-            await self.session.refresh(achievement)
-            return achievement
+            async with self._tx():
+                result = await self.session.execute(stmt)
 
         except SQLAlchemyError:
-            await self.session.rollback()
             logger.exception(
                 "[БД] Ошибка обновления достижения %s",
                 achievement_uuid,
             )
             raise
 
+        if result.rowcount == 0:
+            return None
+
+        await self._after_commit(self._invalidate_cache)
+        return await self.session.get(
+            Achievements, achievement_uuid, populate_existing=True
+        )
+
     async def delete_achievement(
             self,
             achievement_uuid: str,
@@ -187,19 +316,18 @@ class AchievementsRepo(BaseRepo):
         )
 
         try:
-            result = await self.session.execute(stmt)
-
-            if result.rowcount == 0:
-                await self.session.rollback()
-                return False
-
-            await self.session.commit()
-            return True
+            async with self._tx():
+                result = await self.session.execute(stmt)
 
         except SQLAlchemyError:
-            await self.session.rollback()
             logger.exception(
                 "[БД] Ошибка удаления достижения %s",
                 achievement_uuid,
             )
-            raise
\ No newline at end of file
+            raise
+
+        if result.rowcount == 0:
+            return False
+
+        await self._after_commit(self._invalidate_cache)
+        return True
\ No newline at end of file
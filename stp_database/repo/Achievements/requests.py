@@ -11,6 +11,7 @@ from stp_database.repo.Achievements.activations import ActivationsRepo
 from stp_database.repo.Achievements.log_achievements import (
     LogAchievementsRepo,
 )
+from stp_database.repo.cache import CatalogCache
 
 
 @dataclass
@@ -18,11 +19,12 @@ class AchievementsRequestsRepo:
     """Репозитории базы данных достижений."""
 
     session: AsyncSession
+    achievements_cache: CatalogCache | None = None
 
     @property
     def achievements(self) -> AchievementsRepo:
         """Работа со списком достижений."""
-        return AchievementsRepo(self.session)
+        return AchievementsRepo(self.session, self.achievements_cache)
 
     @property
     def achievement_logs(self) -> LogAchievementsRepo:
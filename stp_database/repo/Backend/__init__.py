@@ -1,7 +1,11 @@
 """Репозитории для работы с таблицами системы Questions."""
 
+from .audit_buffer import AuditLogBuffer
 from .requests import BackendRequestsRepo
+from .token_cache import TokenCache
 
 __all__ = [
+    "AuditLogBuffer",
     "BackendRequestsRepo",
+    "TokenCache",
 ]
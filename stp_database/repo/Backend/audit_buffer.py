@@ -0,0 +1,132 @@
+"""Буфер записей аудита API токенов."""
+
+import asyncio
+import logging
+from typing import Any
+
+from sqlalchemy import insert
+from sqlalchemy.exc import SQLAlchemyError
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
+
+from stp_database.models.Backend.tokens import ApiTokenAuditLog
+
+logger = logging.getLogger(__name__)
+
+
+class AuditLogBuffer:
+    """Буфер, записывающий аудит токенов в БД пачками в фоновой задаче.
+
+    Записи аудита складываются в очередь в памяти процесса и вставляются
+    одним многострочным INSERT, как только накопится max_batch записей
+    или пройдет flush_interval секунд с первой записи пачки. Это убирает
+    отдельный INSERT и COMMIT из каждого запроса к API.
+
+    Объект буфера создается один раз при старте приложения, запускается
+    через start() и останавливается через stop(), который дописывает
+    оставшиеся в очереди записи.
+
+    Attributes:
+        session_pool: Фабрика сессий для записи аудита
+        max_batch: Максимальное кол-во записей в одном INSERT
+        flush_interval: Максимальное время ожидания пачки в секундах
+    """
+
+    def __init__(
+        self,
+        session_pool: async_sessionmaker[AsyncSession],
+        max_batch: int = 100,
+        flush_interval: float = 0.5,
+        max_size: int = 10000,
+    ):
+        """Инициализация буфера.
+
+        Args:
+            session_pool: Фабрика сессий для записи аудита
+            max_batch: Максимальное кол-во записей в одном INSERT (по умолчанию 100)
+            flush_interval: Максимальное время ожидания пачки в секундах (по умолчанию 0.5)
+            max_size: Максимальное кол-во записей в очереди (по умолчанию 10000)
+        """
+        self.session_pool = session_pool
+        self.max_batch = max_batch
+        self.flush_interval = flush_interval
+        self._queue: asyncio.Queue[dict[str, Any] | None] = asyncio.Queue(
+            maxsize=max_size
+        )
+        self._task: asyncio.Task | None = None
+
+    def put(self, row: dict[str, Any]) -> None:
+        """Добавление записи аудита в очередь.
+
+        При переполнении очереди запись отбрасывается с предупреждением,
+        чтобы запись аудита не замедляла обработку запросов.
+
+        Args:
+            row: Значения колонок ApiTokenAuditLog
+        """
+        try:
+            self._queue.put_nowait(row)
+        except asyncio.QueueFull:
+            logger.warning("[БД] Очередь аудита переполнена, запись отброшена")
+
+    def start(self) -> None:
+        """Запуск фоновой задачи записи аудита."""
+        if self._task is None:
+            self._task = asyncio.create_task(self._run())
+
+    async def stop(self) -> None:
+        """Остановка фоновой задачи с записью оставшихся в очереди записей."""
+        if self._task is not None:
+            # None сигнализирует задаче записать текущую пачку и завершиться
+            await self._queue.put(None)
+            await self._task
+            self._task = None
+
+        while not self._queue.empty():
+            await self._flush(self._drain(self.max_batch))
+
+    def _drain(self, limit: int) -> list[dict[str, Any]]:
+        rows = []
+        while len(rows) < limit and not self._queue.empty():
+            row = self._queue.get_nowait()
+            if row is not None:
+                rows.append(row)
+        return rows
+
+    async def _run(self) -> None:
+        loop = asyncio.get_running_loop()
+        while True:
+            row = await self._queue.get()
+            if row is None:
+                return
+
+            rows = [row]
+            stopping = False
+            deadline = loop.time() + self.flush_interval
+
+            while len(rows) < self.max_batch:
+                timeout = deadline - loop.time()
+                if timeout <= 0:
+                    break
+                try:
+                    row = await asyncio.wait_for(self._queue.get(), timeout)
+                except asyncio.TimeoutError:
+                    break
+                if row is None:
+                    stopping = True
+                    break
+                rows.append(row)
+
+            await self._flush(rows)
+            if stopping:
+                return
+
+    async def _flush(self, rows: list[dict[str, Any]]) -> None:
+        if not rows:
+            return
+
+        try:
+            async with self.session_pool() as session:
+                await session.execute(insert(ApiTokenAuditLog), rows)
+                await session.commit()
+        except SQLAlchemyError as e:
+            logger.error(f"[БД] Ошибка записи {len(rows)} записей аудита: {e}")
@@ -1,9 +1,12 @@
 """Репозиторий для работы с моделями БД STP."""
 
 from dataclasses import dataclass
+from functools import cached_property
 
 from sqlalchemy.ext.asyncio import AsyncSession
 
+from stp_database.repo.Backend.audit_buffer import AuditLogBuffer
+from stp_database.repo.Backend.token_cache import TokenCache
 from stp_database.repo.Backend.tokens import ApiTokenRepo
 
 
@@ -15,8 +18,10 @@ class BackendRequestsRepo:
     """
 
     session: AsyncSession
+    token_cache: TokenCache | None = None
+    audit_buffer: AuditLogBuffer | None = None
 
-    @property
+    @cached_property
     def api_token(self) -> ApiTokenRepo:
         """Инициализация репозитория ApiTokenRepo с сессией для работы с API токенами."""
-        return ApiTokenRepo(self.session)
+        return ApiTokenRepo(self.session, self.token_cache, self.audit_buffer)
@@ -0,0 +1,183 @@
+"""Кеш API токенов в Redis."""
+
+import json
+import logging
+import time
+from datetime import datetime
+from typing import TYPE_CHECKING
+
+from sqlalchemy import DateTime
+
+from stp_database.models.Backend.tokens import ApiToken
+
+if TYPE_CHECKING:
+    from redis.asyncio import Redis
+
+logger = logging.getLogger(__name__)
+
+
+class TokenCache:
+    """Кеш строк токенов в Redis по token_hash.
+
+    Хранит все колонки токена, кроме token_hash (он является ключом), чтобы
+    не выполнять SELECT по tokens на каждый запрос к API и получать из кеша
+    полностью загруженный объект токена.
+
+    Перед Redis стоит небольшой кеш в памяти процесса с коротким TTL, чтобы
+    повторные запросы с тем же токеном не ходили и в Redis. Инвалидация
+    публикуется в канал Redis; для мгновенного удаления записей из памяти
+    всех процессов в каждом из них запускается listen_invalidations().
+
+    Attributes:
+        redis: Асинхронный клиент Redis
+        max_ttl: Максимальное время жизни записи в секундах
+        prefix: Префикс ключей в Redis
+        local_ttl: Время жизни записи в памяти процесса в секундах (0 - отключено)
+        local_maxsize: Максимальное кол-во записей в памяти процесса
+    """
+
+    FIELDS = tuple(
+        column.key for column in ApiToken.__table__.columns if column.key != "token_hash"
+    )
+    DATETIME_FIELDS = tuple(
+        column.key
+        for column in ApiToken.__table__.columns
+        if isinstance(column.type, DateTime)
+    )
+
+    def __init__(
+        self,
+        redis: "Redis",
+        max_ttl: int = 300,
+        prefix: str = "tok:",
+        local_ttl: float = 5,
+        local_maxsize: int = 10000,
+    ):
+        """Инициализация кеша.
+
+        Args:
+            redis: Асинхронный клиент Redis
+            max_ttl: Максимальное время жизни записи в секундах (по умолчанию 300)
+            prefix: Префикс ключей в Redis (по умолчанию "tok:")
+            local_ttl: Время жизни записи в памяти процесса в секундах (по умолчанию 5)
+            local_maxsize: Максимальное кол-во записей в памяти процесса (по умолчанию 10000)
+        """
+        self.redis = redis
+        self.max_ttl = max_ttl
+        self.prefix = prefix
+        self.local_ttl = local_ttl
+        self.local_maxsize = local_maxsize
+        self._local: dict[bytes, tuple[float, dict]] = {}
+
+    def _key(self, token_hash: bytes) -> str:
+        return f"{self.prefix}{token_hash.hex()}"
+
+    @property
+    def _channel(self) -> str:
+        return f"{self.prefix}invalidate"
+
+    def _local_get(self, token_hash: bytes) -> dict | None:
+        entry = self._local.get(token_hash)
+        if entry is None:
+            return None
+        if entry[0] <= time.monotonic():
+            self._local.pop(token_hash, None)
+            return None
+        return {**entry[1]}
+
+    def _local_set(self, token_hash: bytes, data: dict, ttl: float) -> None:
+        if self.local_ttl <= 0:
+            return
+        if len(self._local) >= self.local_maxsize:
+            # Вытесняем самую старую запись
+            self._local.pop(next(iter(self._local)), None)
+        self._local[token_hash] = (time.monotonic() + min(ttl, self.local_ttl), data)
+
+    async def get(self, token_hash: bytes) -> dict | None:
+        """Получение данных токена из кеша.
+
+        Args:
+            token_hash: SHA-256 хеш токена
+
+        Returns:
+            Словарь с полями токена или None, если записи нет
+            или она записана с другим набором полей
+        """
+        data = self._local_get(token_hash)
+        if data is not None:
+            return data
+
+        key = self._key(token_hash)
+        payload, ttl = await self.redis.pipeline().get(key).ttl(key).execute()
+        if payload is None:
+            return None
+
+        data = json.loads(payload)
+        if data.keys() != set(self.FIELDS):
+            # Запись сохранена другой версией модели токена
+            return None
+        for field in self.DATETIME_FIELDS:
+            if data[field] is not None:
+                data[field] = datetime.fromisoformat(data[field])
+
+        self._local_set(token_hash, data, ttl if ttl > 0 else self.local_ttl)
+        return {**data}
+
+    async def set(self, token_hash: bytes, token: ApiToken) -> None:
+        """Сохранение токена в кеш.
+
+        Время жизни записи ограничено как max_ttl, так и сроком действия токена.
+
+        Args:
+            token_hash: SHA-256 хеш токена
+            token: Объект токена
+        """
+        ttl = self.max_ttl
+        if token.expires_at is not None:
+            ttl = min(ttl, int((token.expires_at - datetime.now()).total_seconds()))
+        if ttl <= 0:
+            return
+
+        data = {field: getattr(token, field) for field in self.FIELDS}
+        self._local_set(token_hash, {**data}, ttl)
+        for field in self.DATETIME_FIELDS:
+            if data[field] is not None:
+                data[field] = data[field].isoformat()
+
+        await self.redis.setex(
+            self._key(token_hash), ttl, json.dumps(data, ensure_ascii=False)
+        )
+
+    async def invalidate(self, token_hash: bytes) -> None:
+        """Удаление токена из кеша.
+
+        Запись удаляется из памяти текущего процесса и из Redis, а хеш
+        публикуется в канал инвалидации для остальных процессов.
+
+        Args:
+            token_hash: SHA-256 хеш токена
+        """
+        self._local.pop(token_hash, None)
+        await self.redis.delete(self._key(token_hash))
+        await self.redis.publish(self._channel, token_hash.hex())
+
+    async def listen_invalidations(self) -> None:
+        """Удаление из памяти процесса токенов, инвалидированных другими процессами.
+
+        Работает до отмены задачи, запускается через asyncio.create_task
+        при старте приложения. Без него отозванный в другом процессе токен
+        остается в памяти не дольше local_ttl секунд.
+        """
+        pubsub = self.redis.pubsub()
+        await pubsub.subscribe(self._channel)
+        try:
+            async for message in pubsub.listen():
+                if message["type"] != "message":
+                    continue
+                token_hash = message["data"]
+                if isinstance(token_hash, bytes):
+                    token_hash = token_hash.decode()
+                self._local.pop(bytes.fromhex(token_hash), None)
+        finally:
+            await pubsub.unsubscribe(self._channel)
+            await pubsub.reset()
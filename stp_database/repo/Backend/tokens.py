@@ -1,21 +1,164 @@
 """Репозиторий для работы с API токенами."""
 
-import hashlib
+import json
 import logging
 import secrets
 from datetime import datetime, timedelta
-
-from sqlalchemy import and_, select
+from hashlib import sha256
+from typing import Callable, NamedTuple, Sequence
+
+from sqlalchemy import (
+    RowMapping,
+    Select,
+    bindparam,
+    case,
+    delete,
+    func,
+    or_,
+    select,
+    text,
+    update,
+)
 from sqlalchemy.exc import SQLAlchemyError
+from sqlalchemy.orm import make_transient_to_detached, selectinload, undefer_group
 
 from stp_database.models.Backend.tokens import ApiToken, ApiTokenAuditLog
+from stp_database.repo.Backend.audit_buffer import AuditLogBuffer
+from stp_database.repo.Backend.token_cache import TokenCache
 from stp_database.repo.base import BaseRepo
 
 logger = logging.getLogger(__name__)
 
+# Точность обновления tokens.last_used_at при валидации токена
+LAST_USED_RESOLUTION_SECONDS = 60
+
+_VALIDATE_RAW_SQL = (
+    "SELECT id, employee_id, expires_at, permissions FROM tokens "
+    "WHERE token_hash = %s AND is_active = 1 "
+    "AND (expires_at IS NULL OR expires_at > NOW())"
+)
+
+
+# Запросы горячих путей строятся один раз при импорте модуля,
+# параметры передаются при выполнении
+_ACTIVE_TOKEN_STMT = select(ApiToken).where(
+    ApiToken.token_hash == bindparam("token_hash"),
+    ApiToken.is_active,
+    or_(ApiToken.expires_at.is_(None), ApiToken.expires_at > func.now()),
+)
+# Выполняется только при неудачной валидации, чтобы привязать аудит к истекшему токену
+_EXPIRED_TOKEN_ID_STMT = select(ApiToken.id).where(
+    ApiToken.token_hash == bindparam("token_hash"),
+    ApiToken.is_active,
+    ApiToken.expires_at <= func.now(),
+)
+
+
+# Колонки аудита из группы отложенной загрузки "cold"
+_AUDIT_DETAIL_COLUMNS = frozenset({"user_agent", "error_message", "extra_metadata"})
+
+
+class TokenRow(NamedTuple):
+    """Минимальный набор полей действующего токена для проверки доступа."""
+
+    id: int
+    employee_id: int
+    expires_at: datetime | None
+    permissions: dict
+
+
+def select_tokens(*loads: str) -> Select[tuple[ApiToken]]:
+    """Построение запроса к токенам с подгрузкой только запрошенных отношений.
+
+    Args:
+        *loads: Названия отношений ApiToken для подгрузки (например, "audit_logs")
+
+    Returns:
+        Запрос select(ApiToken) с опциями selectinload для переданных отношений
+    """
+    return select(ApiToken).options(
+        *(selectinload(getattr(ApiToken, relationship)) for relationship in loads)
+    )
+
+
+def _allow_all(resource: str, action: str) -> bool:
+    return True
+
+
+def _compile_permissions(permissions: dict) -> Callable[[str, str], bool]:
+    """Компиляция JSON разрешений токена в функцию проверки для check_permission.
+
+    Args:
+        permissions: JSON с разрешениями токена
+
+    Returns:
+        Функция (resource, action) -> bool. Для admin токена всегда возвращает True
+    """
+    if permissions.get("admin") is True:
+        return _allow_all
+
+    # Ресурсы, для которых разрешены все действия, и пары (ресурс, действие)
+    all_actions: set[str] = set()
+    allowed: set[tuple[str, str]] = set()
+    for resource, resource_perm in (permissions.get("resources") or {}).items():
+        if resource_perm is True:
+            all_actions.add(resource)
+        elif isinstance(resource_perm, str):
+            allowed.add((resource, resource_perm))
+        elif isinstance(resource_perm, list):
+            allowed.update(
+                (resource, action)
+                for action in resource_perm
+                if isinstance(action, str)
+            )
+
+    all_actions_set = frozenset(all_actions)
+    allowed_set = frozenset(allowed)
+
+    def check(resource: str, action: str) -> bool:
+        return resource in all_actions_set or (resource, action) in allowed_set
+
+    return check
+
+
+def _permission_checker(token: ApiToken) -> Callable[[str, str], bool]:
+    """Получение функции проверки разрешений, сохраненной на объекте токена.
+
+    Функция пересобирается, если токену присвоен другой словарь permissions.
+    """
+    cached = getattr(token, "_permission_check", None)
+    permissions = token.permissions or {}
+    if cached is None or cached[0] is not permissions:
+        cached = (permissions, _compile_permissions(permissions))
+        token._permission_check = cached
+    return cached[1]
+
 
 class ApiTokenRepo(BaseRepo):
-    """Репозиторий для работы с API токенами."""
+    """Репозиторий для работы с API токенами.
+
+    Attributes:
+        cache: Кеш токенов в Redis (опционально)
+        audit_buffer: Буфер пакетной записи аудита (опционально)
+    """
+
+    def __init__(
+        self,
+        session,
+        cache: TokenCache | None = None,
+        audit_buffer: AuditLogBuffer | None = None,
+    ):
+        """Инициализация репозитория.
+
+        Args:
+            session: Сессия SQLAlchemy
+            cache: Кеш токенов в Redis (опционально)
+            audit_buffer: Буфер пакетной записи аудита (опционально).
+                Если не передан, каждая запись аудита сохраняется отдельным коммитом
+        """
+        super().__init__(session)
+        self.cache = cache
+        self.audit_buffer = audit_buffer
 
     async def create_token(
         self,
@@ -94,6 +237,9 @@ class ApiTokenRepo(BaseRepo):
     ) -> ApiToken | None:
         """Валидация API токена.
 
+        Обновляет last_used_at в БД не чаще раза в LAST_USED_RESOLUTION_SECONDS
+        секунд. Значение last_used_at у возвращаемого объекта не обновляется.
+
         Args:
             raw_token: RAW токен
             ip_address: IP адрес клиента
@@ -105,49 +251,50 @@ class ApiTokenRepo(BaseRepo):
         """
         token_hash = self._hash_token(raw_token)
 
-        query = select(ApiToken).where(
-            and_(
-                ApiToken.token_hash == token_hash,
-                ApiToken.is_active,
-            )
-        )
-
         try:
-            result = await self.session.execute(query)
-            token: ApiToken | None = result.scalar_one_or_none()
+            token = await self._get_active_token(token_hash)
 
             if token is None:
-                # Создаем запись аудита о неудачной попытке (без token_id)
-                await self._create_audit_log(
-                    token_id=None,
-                    action="token_validation_failed",
-                    success=False,
-                    error_message="Токен не найден или неактивен",
-                    ip_address=ip_address,
-                    user_agent=user_agent,
-                    endpoint=endpoint,
+                # Аудит пишется только для истекшего токена: token_audit_logs.token_id
+                # не может быть NULL, поэтому попытки с неизвестным или
+                # отозванным токеном в аудит не попадают
+                expired_token_id = await self.session.scalar(
+                    _EXPIRED_TOKEN_ID_STMT, {"token_hash": token_hash}
                 )
+                if expired_token_id is not None:
+                    await self._create_audit_log(
+                        token_id=expired_token_id,
+                        action="token_validation_failed",
+                        success=False,
+                        error_message="Токен истек",
+                        ip_address=ip_address,
+                        user_agent=user_agent,
+                        endpoint=endpoint,
+                    )
                 return None
 
-            # Проверяем срок действия
-            if token.expires_at and token.expires_at < datetime.now():
-                # Токен истек
-                await self._create_audit_log(
-                    token_id=token.id,
-                    action="token_validation_failed",
-                    success=False,
-                    error_message="Токен истек",
-                    ip_address=ip_address,
-                    user_agent=user_agent,
-                    endpoint=endpoint,
+            # Обновляем время последнего использования одним UPDATE по первичному ключу
+            # с серверным NOW(). Строка не перезаписывается, если токен уже
+            # использовался в течение LAST_USED_RESOLUTION_SECONDS секунд.
+            await self.session.execute(
+                update(ApiToken)
+                .where(
+                    ApiToken.id == token.id,
+                    or_(
+                        ApiToken.last_used_at.is_(None),
+                        ApiToken.last_used_at
+                        < func.date_sub(
+                            func.now(),
+                            text(f"INTERVAL {LAST_USED_RESOLUTION_SECONDS} SECOND"),
+                        ),
+                    ),
                 )
-                return None
-
-            # Обновляем время последнего использования
-            token.last_used_at = datetime.now()
-            await self.session.commit()
+                .values(last_used_at=func.now())
+                .execution_options(synchronize_session=False)
+            )
 
-            # Создаем запись аудита об успешном использовании
+            # Запись аудита об успешном использовании сохраняется
+            # одним коммитом вместе с last_used_at
             await self._create_audit_log(
                 token_id=token.id,
                 action="token_used",
@@ -155,13 +302,47 @@ class ApiTokenRepo(BaseRepo):
                 ip_address=ip_address,
                 user_agent=user_agent,
                 endpoint=endpoint,
+                commit=False,
             )
+            await self.session.commit()
 
             return token
         except SQLAlchemyError as e:
             logger.error(f"[БД] Ошибка валидации API токена: {e}")
+            await self.session.rollback()
             return None
 
+    async def validate_token_raw(self, raw_token: str) -> TokenRow | None:
+        """Быстрая проверка API токена в обход ORM.
+
+        Выполняет один SELECT через DB-API драйвера без создания ORM объекта,
+        не обновляет last_used_at и не пишет аудит. Подходит для middleware,
+        которому нужны только владелец и разрешения токена.
+
+        Args:
+            raw_token: RAW токен
+
+        Returns:
+            TokenRow действующего токена или None если токен невалиден
+        """
+        token_hash = self._hash_token(raw_token)
+
+        try:
+            conn = await self.session.connection()
+            result = await conn.exec_driver_sql(_VALIDATE_RAW_SQL, (token_hash,))
+            row = result.fetchone()
+        except SQLAlchemyError as e:
+            logger.error(f"[БД] Ошибка валидации API токена: {e}")
+            return None
+
+        if row is None:
+            return None
+
+        token_id, employee_id, expires_at, permissions = row
+        if isinstance(permissions, (str, bytes)):
+            permissions = json.loads(permissions)
+        return TokenRow(token_id, employee_id, expires_at, permissions or {})
+
     async def revoke_token(self, token_id: int) -> bool:
         """Отзыв API токена.
 
@@ -171,24 +352,34 @@ class ApiTokenRepo(BaseRepo):
         Returns:
             True если успешно, иначе False
         """
-        query = select(ApiToken).where(ApiToken.id == token_id)
-
         try:
-            result = await self.session.execute(query)
-            token: ApiToken | None = result.scalar_one_or_none()
+            # Хеш нужен только для инвалидации кеша
+            token_hash = None
+            if self.cache is not None:
+                token_hash = await self.session.scalar(
+                    select(ApiToken.token_hash).where(ApiToken.id == token_id)
+                )
 
-            if token is None:
+            result = await self.session.execute(
+                update(ApiToken)
+                .where(ApiToken.id == token_id)
+                .values(is_active=False)
+                .execution_options(synchronize_session=False)
+            )
+            if result.rowcount == 0:
                 logger.warning(f"[БД] Токен с ID {token_id} не найден")
                 return False
 
-            token.is_active = False
             await self.session.commit()
 
+            if token_hash is not None:
+                await self.cache.invalidate(token_hash)
+
             logger.info(f"[БД] Токен {token_id} отозван")
 
             # Создаем запись аудита
             await self._create_audit_log(
-                token_id=token.id,
+                token_id=token_id,
                 action="token_revoked",
                 success=True,
             )
@@ -202,6 +393,9 @@ class ApiTokenRepo(BaseRepo):
     async def extend_token(self, token_id: int, days: int) -> ApiToken | None:
         """Продление срока действия API токена.
 
+        Новая дата истечения вычисляется в БД одним UPDATE: бессрочный токен
+        получает срок от текущей даты, остальные продлеваются от expires_at.
+
         Args:
             token_id: Идентификатор токена
             days: Количество дней для продления
@@ -209,31 +403,41 @@ class ApiTokenRepo(BaseRepo):
         Returns:
             Обновленный объект ApiToken или None
         """
-        query = select(ApiToken).where(ApiToken.id == token_id)
+        interval = text("INTERVAL :days DAY").bindparams(days=days)
 
         try:
-            result = await self.session.execute(query)
-            token: ApiToken | None = result.scalar_one_or_none()
-
-            if token is None:
+            result = await self.session.execute(
+                update(ApiToken)
+                .where(ApiToken.id == token_id)
+                .values(
+                    expires_at=case(
+                        (
+                            ApiToken.expires_at.is_(None),
+                            func.date_add(func.now(), interval),
+                        ),
+                        else_=func.date_add(ApiToken.expires_at, interval),
+                    )
+                )
+                .execution_options(synchronize_session=False)
+            )
+            if result.rowcount == 0:
                 logger.warning(f"[БД] Токен с ID {token_id} не найден")
                 return None
 
-            # Если expires_at был None, устанавливаем от текущей даты
-            if token.expires_at is None:
-                token.expires_at = datetime.now() + timedelta(days=days)
-            else:
-                # Добавляем дни к существующей дате
-                token.expires_at = token.expires_at + timedelta(days=days)
-
             await self.session.commit()
-            await self.session.refresh(token)
+
+            token = await self.session.get(
+                ApiToken, token_id, populate_existing=True
+            )
+
+            if self.cache is not None:
+                await self.cache.invalidate(token.token_hash)
 
             logger.info(f"[БД] Срок действия токена {token_id} продлен на {days} дней")
 
             # Создаем запись аудита
             await self._create_audit_log(
-                token_id=token.id,
+                token_id=token_id,
                 action="token_extended",
                 success=True,
                 metadata={"days": days},
@@ -245,29 +449,66 @@ class ApiTokenRepo(BaseRepo):
             await self.session.rollback()
             return None
 
-    async def get_user_tokens(self, employee_id: int) -> list[ApiToken]:
+    async def get_user_tokens(
+        self,
+        employee_id: int,
+        load: Sequence[str] = (),
+    ) -> Sequence[ApiToken]:
         """Получение списка токенов сотрудника.
 
         Args:
             employee_id: Идентификатор сотрудника
+            load: Отношения токена для подгрузки (например, ("employee", "audit_logs"))
 
         Returns:
             Список токенов, отсортированный по created_at DESC
         """
         query = (
-            select(ApiToken)
-            .where(ApiToken.employee_id == employee_id)
+            select_tokens(*load)
+            .where(ApiToken.employee_id == bindparam("employee_id"))
             .order_by(ApiToken.created_at.desc())
         )
 
         try:
-            result = await self.session.execute(query)
-            return list(result.scalars().all())
+            result = await self.session.execute(query, {"employee_id": employee_id})
+            return result.scalars().all()
         except SQLAlchemyError as e:
             logger.error(f"[БД] Ошибка получения токенов сотрудника {employee_id}: {e}")
             return []
 
-    async def check_permission(
+    async def get_admin_tokens(
+        self,
+        active_only: bool = True,
+        load: Sequence[str] = (),
+    ) -> Sequence[ApiToken]:
+        """Получение токенов с admin правами.
+
+        Фильтрация выполняется в БД по вычисляемой колонке is_admin
+        (индекс idx_admin_active), без разбора permissions каждого токена.
+
+        Args:
+            active_only: Только активные и не истекшие токены
+            load: Отношения токена для подгрузки (например, ("employee",))
+
+        Returns:
+            Список токенов, отсортированный по created_at DESC
+        """
+        query = select_tokens(*load).where(ApiToken.is_admin)
+        if active_only:
+            query = query.where(
+                ApiToken.is_active,
+                or_(ApiToken.expires_at.is_(None), ApiToken.expires_at > func.now()),
+            )
+        query = query.order_by(ApiToken.created_at.desc())
+
+        try:
+            result = await self.session.execute(query)
+            return result.scalars().all()
+        except SQLAlchemyError as e:
+            logger.error(f"[БД] Ошибка получения admin токенов: {e}")
+            return []
+
+    def check_permission(
         self,
         token: ApiToken,
         resource: str,
@@ -275,6 +516,9 @@ class ApiTokenRepo(BaseRepo):
     ) -> bool:
         """Проверка разрешения токена.
 
+        Разрешения компилируются в функцию проверки один раз на объект токена,
+        последующие проверки сводятся к поиску в множестве.
+
         Args:
             token: Объект токена
             resource: Ресурс (например, "employees")
@@ -283,40 +527,24 @@ class ApiTokenRepo(BaseRepo):
         Returns:
             True если разрешено, иначе False
         """
-        permissions = token.permissions
-
-        # Проверяем admin права
-        if permissions.get("admin") is True:
-            return True
-
-        # Проверяем разрешения для конкретного ресурса
-        resources = permissions.get("resources", {})
-        resource_perm = resources.get(resource)
-
-        if resource_perm is None or resource_perm is False:
-            return False
-        elif resource_perm is True:
-            # Все действия разрешены для этого ресурса
-            return True
-        elif isinstance(resource_perm, str):
-            # Проверяем точное совпадение действия
-            return resource_perm == action
-        elif isinstance(resource_perm, list):
-            # Проверяем наличие действия в списке
-            return action in resource_perm
-
-        return False
+        return _permission_checker(token)(resource, action)
 
     async def get_token_audit_logs(
         self,
         token_id: int,
         limit: int = 100,
-    ) -> list[ApiTokenAuditLog]:
+        include_details: bool = True,
+    ) -> Sequence[ApiTokenAuditLog]:
         """Получение логов аудита токена.
 
+        При include_details=False колонки user_agent, error_message и
+        extra_metadata не загружаются, и обращение к ним у возвращенных
+        записей вызывает InvalidRequestError.
+
         Args:
             token_id: Идентификатор токена
             limit: Максимальное количество записей
+            include_details: Загрузить отложенные колонки (user_agent, error_message, extra_metadata)
 
         Returns:
             Список записей аудита, отсортированный по created_at DESC
@@ -327,10 +555,50 @@ class ApiTokenRepo(BaseRepo):
             .order_by(ApiTokenAuditLog.created_at.desc())
             .limit(limit)
         )
+        if include_details:
+            query = query.options(undefer_group("cold"))
 
         try:
             result = await self.session.execute(query)
-            return list(result.scalars().all())
+            return result.scalars().all()
+        except SQLAlchemyError as e:
+            logger.error(f"[БД] Ошибка получения логов аудита токена {token_id}: {e}")
+            return []
+
+    async def get_token_audit_logs_raw(
+        self,
+        token_id: int,
+        limit: int = 100,
+        include_details: bool = False,
+    ) -> Sequence[RowMapping]:
+        """Получение логов аудита токена в виде словарей без создания ORM объектов.
+
+        Подходит для эндпоинтов, которые сразу сериализуют записи в JSON.
+
+        Args:
+            token_id: Идентификатор токена
+            limit: Максимальное количество записей
+            include_details: Включить колонки user_agent, error_message и extra_metadata
+
+        Returns:
+            Список записей аудита {колонка: значение}, отсортированный по created_at DESC
+        """
+        table = ApiTokenAuditLog.__table__
+        columns = [
+            column
+            for column in table.c
+            if include_details or column.key not in _AUDIT_DETAIL_COLUMNS
+        ]
+        query = (
+            select(*columns)
+            .where(table.c.token_id == token_id)
+            .order_by(table.c.created_at.desc())
+            .limit(limit)
+        )
+
+        try:
+            result = await self.session.execute(query)
+            return result.mappings().all()
         except SQLAlchemyError as e:
             logger.error(f"[БД] Ошибка получения логов аудита токена {token_id}: {e}")
             return []
@@ -349,25 +617,18 @@ class ApiTokenRepo(BaseRepo):
         """
         cutoff_date = datetime.now() - timedelta(days=days_inactive)
 
-        # Находим токены для удаления
-        query = select(ApiToken).where(
-            and_(
-                not ApiToken.is_active,
-                ApiToken.expires_at < cutoff_date,
-            )
+        # Логи аудита удаляются каскадно по внешнему ключу
+        query = delete(ApiToken).where(
+            ApiToken.is_active.is_(False),
+            ApiToken.expires_at < cutoff_date,
         )
 
         try:
             result = await self.session.execute(query)
-            tokens = result.scalars().all()
-
-            deleted_count = 0
-            for token in tokens:
-                await self.session.delete(token)
-                deleted_count += 1
+            await self.session.commit()
 
+            deleted_count = result.rowcount
             if deleted_count > 0:
-                await self.session.commit()
                 logger.info(f"[БД] Удалено {deleted_count} неактивных токенов")
 
             return deleted_count
@@ -376,26 +637,66 @@ class ApiTokenRepo(BaseRepo):
             await self.session.rollback()
             return 0
 
+    async def _get_active_token(self, token_hash: bytes) -> ApiToken | None:
+        """Получение активного и не истекшего токена по хешу с использованием кеша.
+
+        Срок действия проверяется в БД. При попадании в кеш токен присоединяется
+        к сессии без SELECT: время жизни записи кеша не превышает срок действия токена.
+        Кеш хранит все колонки токена, поэтому объект из кеша загружен так же
+        полностью, как из SELECT; отношения в обоих случаях подгружаются только
+        явно (lazy="raise_on_sql").
+
+        Args:
+            token_hash: Хеш токена
+
+        Returns:
+            Объект ApiToken или None, если активный токен не найден
+        """
+        cached = None
+        if self.cache is not None:
+            cached = await self.cache.get(token_hash)
+
+        if cached is not None:
+            token = ApiToken(token_hash=token_hash, **cached)
+            make_transient_to_detached(token)
+            token = await self.session.merge(token, load=False)
+        else:
+            result = await self.session.execute(
+                _ACTIVE_TOKEN_STMT, {"token_hash": token_hash}
+            )
+            token = result.scalar_one_or_none()
+
+            if token is not None and self.cache is not None:
+                await self.cache.set(token_hash, token)
+
+        if token is not None:
+            # Функция проверки разрешений компилируется при загрузке токена
+            _permission_checker(token)
+
+        return token
+
     def _generate_token(self) -> str:
         """Генерация нового токена.
 
         Returns:
             Строка токена в формате 'stp_' + 64 символа hex
         """
-        random_bytes = secrets.token_bytes(32)
-        hex_part = random_bytes.hex()
-        return f"stp_{hex_part}"
+        return f"stp_{secrets.token_hex(32)}"
 
-    def _hash_token(self, raw_token: str) -> str:
+    def _hash_token(self, raw_token: str) -> bytes:
         """Хеширование токена.
 
         Args:
             raw_token: RAW токен
 
         Returns:
-            SHA-256 хеш токена
+            SHA-256 хеш токена (32 байта)
+
+        Хеширование выполняется одним проходом SHA-256 без соли и раундов:
+        токен содержит 256 бит случайных данных, а хранение хеша вместо
+        самого токена не дает использовать токены при утечке БД.
         """
-        return hashlib.sha256(raw_token.encode()).hexdigest()
+        return sha256(raw_token.encode()).digest()
 
     async def _create_audit_log(
         self,
@@ -407,9 +708,15 @@ class ApiTokenRepo(BaseRepo):
         user_agent: str | None = None,
         endpoint: str | None = None,
         metadata: dict | None = None,
+        commit: bool = True,
     ) -> ApiTokenAuditLog | None:
         """Создание записи аудита.
 
+        При наличии audit_buffer запись ставится в очередь и сохраняется
+        в БД фоновой задачей вместе с другими записями.
+        С commit=False запись только добавляется в сессию и сохраняется
+        коммитом вызывающего кода вместе с остальными изменениями.
+
         Args:
             token_id: Идентификатор токена
             action: Действие
@@ -419,23 +726,34 @@ class ApiTokenRepo(BaseRepo):
             user_agent: User Agent
             endpoint: Эндпоинт
             metadata: Дополнительные данные
+            commit: Сохранить запись отдельным коммитом
 
         Returns:
-            Объект ApiTokenAuditLog или None
+            Объект ApiTokenAuditLog или None (в том числе при записи через буфер)
         """
         if token_id is None:
-            # Не можем создать запись аудита без токена
+            # token_audit_logs.token_id - обязательный внешний ключ на tokens
             return None
 
-        audit_log = ApiTokenAuditLog(
-            token_id=token_id,
-            action=action,
-            ip_address=ip_address,
-            user_agent=user_agent,
-            endpoint=endpoint,
-            success=success,
-            error_message=error_message,
-        )
+        values = {
+            "token_id": token_id,
+            "action": action,
+            "ip_address": ip_address,
+            "user_agent": user_agent,
+            "endpoint": endpoint,
+            "success": success,
+            "error_message": error_message,
+            "extra_metadata": metadata,
+        }
+
+        if self.audit_buffer is not None:
+            self.audit_buffer.put({**values, "created_at": datetime.now()})
+            return None
+
+        audit_log = ApiTokenAuditLog(**values)
+        if not commit:
+            self.session.add(audit_log)
+            return audit_log
 
         try:
             self.session.add(audit_log)
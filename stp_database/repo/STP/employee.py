@@ -1,16 +1,226 @@
 """Репозиторий функций для взаимодействия с сотрудниками."""
 
 import logging
-from typing import Any, Sequence
-
-from sqlalchemy import and_, or_, select
+import re
+from functools import lru_cache
+from typing import Any, AsyncIterator, Mapping, Sequence
+
+from sqlalchemy import (
+    ColumnElement,
+    Select,
+    and_,
+    bindparam,
+    delete,
+    insert,
+    inspect,
+    select,
+    union,
+    update,
+)
+from sqlalchemy.dialects.mysql import match
 from sqlalchemy.exc import SQLAlchemyError
-
-from stp_database.models.STP import Employee
+from sqlalchemy.orm import selectinload
+
+from stp_database.models.STP import (
+    Employee,
+    EventLog,
+    Exchange,
+    ExchangeSubscription,
+)
 from stp_database.repo.base import BaseRepo
 
 logger = logging.getLogger(__name__)
 
+# Базовые запросы строятся один раз при импорте модуля,
+# параметры передаются при выполнении
+_UNAUTHORIZED_STMT = select(Employee).where(Employee.user_id.is_(None))
+_UNAUTHORIZED_BY_HEAD_STMT = _UNAUTHORIZED_STMT.where(
+    Employee.head == bindparam("head")
+)
+
+# Колонки, которые можно передать в update_user (кроме вычисляемых)
+_UPDATABLE_COLUMNS = frozenset(
+    column.key for column in Employee.__table__.c if column.computed is None
+)
+
+# Ссылки на employees.user_id, которые обнуляются перед удалением сотрудника
+# (как при удалении через ORM по отношениям Employee)
+_EMPLOYEE_REFERENCES = (
+    EventLog.user_id,
+    Exchange.owner_id,
+    Exchange.counterpart_id,
+    ExchangeSubscription.subscriber_id,
+    ExchangeSubscription.target_seller_id,
+)
+
+
+@lru_cache(maxsize=None)
+def _user_lookup_stmt(fields: tuple[str, ...]) -> Select[tuple[Employee]]:
+    """Запрос поиска сотрудника по равенству набора полей.
+
+    Запрос строится один раз для каждого набора полей, значения
+    передаются при выполнении через параметры с именами полей.
+
+    Args:
+        fields: Названия атрибутов Employee
+
+    Returns:
+        Запрос, возвращающий не более одного сотрудника (с наименьшим id
+        при нескольких совпадениях)
+    """
+    return (
+        select(Employee)
+        .where(*(getattr(Employee, field) == bindparam(field) for field in fields))
+        .order_by(Employee.id)
+        .limit(1)
+    )
+
+
+def _list_users_stmt(
+    main_ids: list[int] | None,
+    employee_ids: list[int] | None,
+    user_ids: list[int] | None,
+    division: str | None,
+    position: str | None,
+    head: str | None,
+    roles: int | list[int] | None,
+    access: bool | None,
+) -> Select[tuple[Employee]]:
+    """Запрос списка сотрудников по фильтрам list_users."""
+    filters = []
+
+    if isinstance(main_ids, list) and main_ids:
+        filters.append(Employee.id.in_(main_ids))
+    if isinstance(employee_ids, list) and employee_ids:
+        filters.append(Employee.employee_id.in_(employee_ids))
+    if isinstance(user_ids, list) and user_ids:
+        filters.append(Employee.user_id.in_(user_ids))
+    if division is not None:
+        filters.append(Employee.division == division)
+    if position is not None:
+        filters.append(Employee.position == position)
+    if head is not None:
+        filters.append(Employee.head == head)
+    if isinstance(roles, int):
+        filters.append(Employee.role == roles)
+    elif isinstance(roles, list) and roles:
+        filters.append(Employee.role.in_(roles))
+    if access is not None:
+        filters.append(Employee.access == access)
+
+    return select(Employee).where(*filters)
+
+
+def _order_by_clause(order_by: str) -> ColumnElement:
+    """Сортировка по атрибуту Employee.
+
+    Args:
+        order_by: Название атрибута Employee, с префиксом "-" для сортировки по убыванию
+
+    Returns:
+        Выражение для ORDER BY
+    """
+    if order_by.startswith("-"):
+        return getattr(Employee, order_by[1:]).desc()
+    return getattr(Employee, order_by).asc()
+
+
+def _load_options(load: Sequence[str]) -> tuple:
+    """Опции selectinload для явно запрошенных отношений Employee.
+
+    Args:
+        load: Названия отношений Employee (например, "event_logs")
+
+    Returns:
+        Кортеж опций загрузчика
+    """
+    return tuple(selectinload(getattr(Employee, relationship)) for relationship in load)
+
+
+# Длина n-граммы полнотекстового индекса по ФИО (ngram_token_size)
+FT_NGRAM_TOKEN_SIZE = 2
+
+# Символы, которые MySQL считает операторами или разделителями в BOOLEAN MODE
+_FT_SPECIAL_CHARS = re.compile(r"[^\w]+")
+
+
+@lru_cache(maxsize=1024)
+def _split_fullname(fullname: str) -> tuple[str, tuple[str, ...]]:
+    """Разбор поискового запроса по ФИО.
+
+    Части ФИО ищутся по ngram индексу idx_fullname_ft как подстроки в любом
+    месте ФИО (как и прежний поиск через ILIKE '%часть%'). Части короче
+    FT_NGRAM_TOKEN_SIZE индекс не находит, поэтому для них остается проверка
+    через ILIKE по уже отобранным строкам.
+
+    Args:
+        fullname: Частичное или полное ФИО
+
+    Returns:
+        Строка для MATCH ... AGAINST (пустая, если слов для индекса нет)
+        и шаблоны ILIKE для коротких частей
+    """
+    words = []
+    patterns = []
+    for part in fullname.split():
+        part_words = [
+            word
+            for word in _FT_SPECIAL_CHARS.split(part)
+            if len(word) >= FT_NGRAM_TOKEN_SIZE
+        ]
+        if part_words:
+            words.extend(part_words)
+        else:
+            patterns.append(f"%{part}%")
+
+    return " ".join(f"+{word}" for word in words), tuple(patterns)
+
+
+@lru_cache(maxsize=None)
+def _fullname_predicate(has_words: bool, patterns_count: int) -> ColumnElement[bool]:
+    """Условие поиска по ФИО с параметрами fio_words и fio_part0..N.
+
+    Условие строится один раз для каждой формы запроса.
+
+    Args:
+        has_words: Есть ли в запросе слова для полнотекстового индекса
+        patterns_count: Кол-во коротких частей, проверяемых через ILIKE
+
+    Returns:
+        Условие, которому должны удовлетворять все части ФИО (AND)
+    """
+    conditions = []
+    if has_words:
+        conditions.append(
+            match(Employee.fullname, against=bindparam("fio_words")).in_boolean_mode()
+        )
+    conditions.extend(
+        Employee.fullname.ilike(bindparam(f"fio_part{index}"))
+        for index in range(patterns_count)
+    )
+    return and_(*conditions)
+
+
+def _fullname_filter(
+    fullname: str,
+) -> tuple[ColumnElement[bool], dict[str, str]] | None:
+    """Условие поиска по частям ФИО и значения его параметров.
+
+    Args:
+        fullname: Частичное или полное ФИО
+
+    Returns:
+        Условие и параметры для execute или None, если запрос пустой
+    """
+    against, patterns = _split_fullname(fullname)
+    if not against and not patterns:
+        return None
+
+    params = {f"fio_part{index}": pattern for index, pattern in enumerate(patterns)}
+    if against:
+        params["fio_words"] = against
+    return _fullname_predicate(bool(against), len(patterns)), params
+
 
 class EmployeeRepo(BaseRepo):
     """Репозиторий для работы с сотрудниками."""
@@ -48,16 +258,56 @@ class EmployeeRepo(BaseRepo):
         )
 
         try:
-            self.session.add(new_user)
-            await self.session.commit()
+            async with self._tx():
+                self.session.add(new_user)
             await self.session.refresh(new_user)
             logger.info(f"[БД] Создан новый пользователь: {fullname}")
             return new_user
         except SQLAlchemyError as e:
             logger.error(f"[БД] Ошибка добавления пользователя {fullname}: {e}")
-            await self.session.rollback()
             return None
 
+    async def add_users_bulk(self, rows: Sequence[Mapping[str, Any]]) -> int:
+        """Добавление нескольких сотрудников одним INSERT.
+
+        Строки вставляются многострочным INSERT в одной транзакции вместо
+        отдельного коммита и refresh на каждого сотрудника.
+
+        Args:
+            rows: Сотрудники в виде словарей с полями add_user
+
+        Returns:
+            Кол-во добавленных сотрудников
+
+        Raises:
+            ValueError: Если в строке передано недопустимое поле
+        """
+        if not rows:
+            return 0
+
+        allowed_fields = {"user_id", "division", "position", "fullname", "head", "role"}
+
+        values = []
+        for row in rows:
+            invalid_fields = set(row) - allowed_fields
+            if invalid_fields:
+                raise ValueError(
+                    "Недопустимые поля сотрудника: " + ", ".join(sorted(invalid_fields))
+                )
+            values.append(
+                {"user_id": None, "role": 0, **row, "is_casino_allowed": True}
+            )
+
+        try:
+            async with self._tx():
+                await self.session.execute(insert(Employee), values)
+        except SQLAlchemyError:
+            logger.exception(f"[БД] Ошибка добавления {len(values)} пользователей")
+            raise
+
+        logger.info(f"[БД] Создано {len(values)} новых пользователей")
+        return len(values)
+
     async def get_users(
             self,
             main_id: int | list[int] | None = None,
@@ -72,108 +322,246 @@ class EmployeeRepo(BaseRepo):
             head: str | None = None,
             roles: int | list[int] | None = None,
             access: bool | None = None,
+            load: Sequence[str] = (),
+            order_by: str | None = None,
     ) -> Employee | None | Sequence[Employee]:
-        """Поиск пользователя или списка пользователей."""
-        is_single = (
-                isinstance(main_id, int)
-                or isinstance(employee_id, int)
-                or isinstance(user_id, int)
-                or username is not None
-                or login is not None
-                or fullname is not None
-                or email is not None
+        """Поиск пользователя или списка пользователей.
+
+        Если передан хотя бы один уникальный признак (int main_id, employee_id,
+        user_id, username, login, fullname или email), возвращается один
+        сотрудник, иначе - список сотрудников по фильтрам.
+
+        Отношения Employee не загружаются лениво (lazy="raise_on_sql"),
+        нужные отношения передаются в load, например load=("event_logs",).
+        Список не сортируется, если не передан order_by (например, "-fullname").
+        """
+        fields = {
+            "id": main_id if isinstance(main_id, int) else None,
+            "employee_id": employee_id if isinstance(employee_id, int) else None,
+            "user_id": user_id if isinstance(user_id, int) else None,
+            "username": username,
+            "login": login,
+            "fullname": fullname,
+            "email": email,
+        }
+        fields = {field: value for field, value in fields.items() if value is not None}
+
+        if not fields:
+            return await self.list_users(
+                main_ids=main_id,
+                employee_ids=employee_id,
+                user_ids=user_id,
+                division=division,
+                position=position,
+                head=head,
+                roles=roles,
+                access=access,
+                load=load,
+                order_by=order_by,
+            )
+
+        if division is not None:
+            fields["division"] = division
+        if position is not None:
+            fields["position"] = position
+        if head is not None:
+            fields["head"] = head
+
+        if fields.keys() == {"id"}:
+            return await self.get_user_by_id(main_id, load=load)
+        if fields.keys() == {"user_id"}:
+            return await self.get_user_by_tg(user_id, load=load)
+        return await self._find_user(fields, load=load)
+
+    async def get_user_by_id(
+        self, main_id: int, load: Sequence[str] = ()
+    ) -> Employee | None:
+        """Получение сотрудника по идентификатору в БД.
+
+        Объект, уже загруженный в сессию, возвращается без запроса к БД,
+        если не запрошена подгрузка отношений.
+
+        Args:
+            main_id: Идентификатор сотрудника в БД
+            load: Названия отношений Employee для подгрузки
+
+        Returns:
+            Объект Employee или None
+        """
+        try:
+            if load:
+                return await self.session.get(
+                    Employee,
+                    main_id,
+                    options=_load_options(load),
+                    populate_existing=True,
+                )
+            return await self.session.get(Employee, main_id)
+        except SQLAlchemyError as e:
+            logger.error(f"[БД] Ошибка получения пользователя: {e}")
+            return None
+
+    async def get_user_by_tg(
+        self, user_id: int, load: Sequence[str] = ()
+    ) -> Employee | None:
+        """Получение сотрудника по идентификатору Telegram.
+
+        Args:
+            user_id: Идентификатор Telegram сотрудника
+            load: Названия отношений Employee для подгрузки
+
+        Returns:
+            Объект Employee или None
+        """
+        return await self._find_user({"user_id": user_id}, load=load)
+
+    async def _find_user(
+        self, fields: dict[str, Any], load: Sequence[str] = ()
+    ) -> Employee | None:
+        """Поиск одного сотрудника по равенству полей.
+
+        Args:
+            fields: Значения атрибутов Employee
+            load: Названия отношений Employee для подгрузки
+
+        Returns:
+            Объект Employee или None
+        """
+        query = _user_lookup_stmt(tuple(fields))
+        if load:
+            query = query.options(*_load_options(load))
+
+        try:
+            result = await self.session.execute(query, fields)
+            return result.scalar_one_or_none()
+        except SQLAlchemyError as e:
+            logger.error(f"[БД] Ошибка получения пользователя: {e}")
+            return None
+
+    async def list_users(
+            self,
+            main_ids: list[int] | None = None,
+            employee_ids: list[int] | None = None,
+            user_ids: list[int] | None = None,
+            division: str | None = None,
+            position: str | None = None,
+            head: str | None = None,
+            roles: int | list[int] | None = None,
+            access: bool | None = None,
+            load: Sequence[str] = (),
+            order_by: str | None = None,
+    ) -> Sequence[Employee]:
+        """Получение списка сотрудников по фильтрам.
+
+        Args:
+            main_ids: Идентификаторы сотрудников в БД
+            employee_ids: Идентификаторы сотрудников из отчетной среды
+            user_ids: Идентификаторы Telegram сотрудников
+            division: Направление
+            position: Должность
+            head: ФИО руководителя
+            roles: Роль или список ролей
+            access: Доступ к веб приложениям и ботам
+            load: Названия отношений Employee для подгрузки
+            order_by: Атрибут для сортировки, "-" в начале - по убыванию (опционально)
+
+        Returns:
+            Список сотрудников
+        """
+        query = _list_users_stmt(
+            main_ids, employee_ids, user_ids, division, position, head, roles, access
+        ).options(*_load_options(load))
+        if order_by:
+            query = query.order_by(_order_by_clause(order_by))
+
+        try:
+            result = await self.session.execute(query)
+            return result.scalars().all()
+        except SQLAlchemyError as e:
+            logger.error(f"[БД] Ошибка получения списка пользователей: {e}")
+            return []
+
+    async def iter_users(
+            self,
+            main_ids: list[int] | None = None,
+            employee_ids: list[int] | None = None,
+            user_ids: list[int] | None = None,
+            division: str | None = None,
+            position: str | None = None,
+            head: str | None = None,
+            roles: int | list[int] | None = None,
+            access: bool | None = None,
+            load: Sequence[str] = (),
+            order_by: str | None = None,
+            batch_size: int = 500,
+    ) -> AsyncIterator[Employee]:
+        """Потоковое получение сотрудников по фильтрам list_users.
+
+        Строки читаются через серверный курсор пачками по batch_size, поэтому
+        в памяти одновременно находится не больше одной пачки. Соединение
+        занято до окончания итерации, поэтому внутри цикла нельзя выполнять
+        другие запросы в этой же сессии.
+
+        Args:
+            main_ids: Идентификаторы сотрудников в БД
+            employee_ids: Идентификаторы сотрудников из отчетной среды
+            user_ids: Идентификаторы Telegram сотрудников
+            division: Направление
+            position: Должность
+            head: ФИО руководителя
+            roles: Роль или список ролей
+            access: Доступ к веб приложениям и ботам
+            load: Названия отношений Employee для подгрузки
+            order_by: Атрибут для сортировки, "-" в начале - по убыванию (опционально)
+            batch_size: Кол-во строк в одной пачке (по умолчанию 500)
+
+        Yields:
+            Объекты Employee
+        """
+        query = (
+            _list_users_stmt(
+                main_ids, employee_ids, user_ids, division, position, head, roles, access
+            )
+            .options(*_load_options(load))
+            .execution_options(yield_per=batch_size)
         )
+        if order_by:
+            query = query.order_by(_order_by_clause(order_by))
 
-        if is_single:
-            filters = []
-
-            if isinstance(main_id, int):
-                filters.append(Employee.id == main_id)
-            if isinstance(employee_id, int):
-                filters.append(Employee.employee_id == employee_id)
-            if isinstance(user_id, int):
-                filters.append(Employee.user_id == user_id)
-            if username is not None:
-                filters.append(Employee.username == username)
-            if login is not None:
-                filters.append(Employee.login == login)
-            if fullname is not None:
-                filters.append(Employee.fullname == fullname)
-            if email is not None:
-                filters.append(Employee.email == email)
-            if division is not None:
-                filters.append(Employee.division == division)
-            if position is not None:
-                filters.append(Employee.position == position)
-            if head is not None:
-                filters.append(Employee.head == head)
-
-            query = select(Employee).where(*filters).order_by(Employee.fullname.desc())
-
-            try:
-                result = await self.session.execute(query)
-                return result.scalars().first()
-            except SQLAlchemyError as e:
-                logger.error(f"[БД] Ошибка получения пользователя: {e}")
-                return None
-        else:
-            filters = []
-
-            if isinstance(main_id, list) and main_id:
-                filters.append(Employee.id.in_(main_id))
-            if isinstance(employee_id, list) and employee_id:
-                filters.append(Employee.employee_id.in_(employee_id))
-            if isinstance(user_id, list) and user_id:
-                filters.append(Employee.user_id.in_(user_id))
-            if division is not None:
-                filters.append(Employee.division == division)
-            if position is not None:
-                filters.append(Employee.position == position)
-            if head is not None:
-                filters.append(Employee.head == head)
-            if roles is not None:
-                if isinstance(roles, int):
-                    filters.append(Employee.role == roles)
-                elif isinstance(roles, list) and roles:
-                    filters.append(Employee.role.in_(roles))
-            if access is not None:
-                filters.append(Employee.access == access)
-            
-            if filters:
-                query = select(Employee).where(*filters).order_by(Employee.fullname.desc())
-            else:
-                query = select(Employee).order_by(Employee.fullname.desc())
-
-            try:
-                result = await self.session.execute(query)
-                return result.scalars().all()
-            except SQLAlchemyError as e:
-                logger.error(f"[БД] Ошибка получения списка пользователей: {e}")
-                return []
-
-    async def get_unauthorized_users(self, head_name: str = None) -> Sequence[Employee]:
+        result = await self.session.stream_scalars(query)
+        try:
+            async for user in result:
+                yield user
+        finally:
+            await result.close()
+
+    async def get_unauthorized_users(
+        self, head_name: str = None, order_by: str | None = None
+    ) -> Sequence[Employee]:
         """Получает список неавторизованных пользователей.
 
         Неавторизованные пользователи - те, у которых отсутствует user_id (не связан с Telegram).
 
         Args:
             head_name: Фильтр по имени руководителя (опционально)
+            order_by: Атрибут для сортировки, "-" в начале - по убыванию (опционально).
+                Сортировка по "fullname" вместе с head_name использует индекс idx_head_fullname
 
         Returns:
             Список неавторизованных пользователей
         """
-        # Основное условие - отсутствие user_id означает что пользователь не авторизован в Telegram
-        base_conditions = [Employee.user_id.is_(None)]
-
-        # Добавляем фильтр по руководителю если указан
+        # Неавторизованные - пользователи без user_id, опционально с фильтром по руководителю
         if head_name:
-            base_conditions.append(Employee.head == head_name)
+            query, params = _UNAUTHORIZED_BY_HEAD_STMT, {"head": head_name}
+        else:
+            query, params = _UNAUTHORIZED_STMT, None
 
-        query = select(Employee).where(*base_conditions).order_by(Employee.fullname)
+        if order_by:
+            query = query.order_by(_order_by_clause(order_by))
 
         try:
-            result = await self.session.execute(query)
-            return list(result.scalars().all())
+            result = await self.session.execute(query, params)
+            return result.scalars().all()
         except SQLAlchemyError as e:
             logger.error(
                 f"[БД] Ошибка получения списка неавторизованных пользователей: {e}"
@@ -195,25 +583,66 @@ class EmployeeRepo(BaseRepo):
 
         Returns:
             Обновленный объект Employee или None
+
+        Raises:
+            ValueError: Если передано неизвестное или вычисляемое поле
         """
+        invalid_keys = kwargs.keys() - _UPDATABLE_COLUMNS
+        if invalid_keys:
+            raise ValueError(
+                "Недопустимые поля сотрудника: " + ", ".join(sorted(invalid_keys))
+            )
+
         conditions = []
         if main_id:
             conditions.append(Employee.id == main_id)
         if user_id:
             conditions.append(Employee.user_id == user_id)
 
-        select_stmt = select(Employee).where(*conditions)
+        if not conditions:
+            return None
 
+        # Сотрудник уже загружен в сессию и значения не меняются - UPDATE не нужен
+        user = self._loaded_user(main_id) if main_id else None
+        if (
+            user is not None
+            and (not user_id or user.user_id == user_id)
+            and not kwargs.keys() & inspect(user).unloaded
+            and all(getattr(user, key) == value for key, value in kwargs.items())
+        ):
+            return user
+
+        if kwargs:
+            async with self._tx():
+                result = await self.session.execute(
+                    update(Employee)
+                    .where(*conditions)
+                    .values(**kwargs)
+                    .execution_options(synchronize_session=False)
+                )
+            # Пользователь не найден - перечитывать нечего
+            if result.rowcount == 0:
+                return None
+
+        select_stmt = (
+            select(Employee)
+            .where(*conditions)
+            .execution_options(populate_existing=True)
+        )
         result = await self.session.execute(select_stmt)
-        user: Employee | None = result.scalar_one_or_none()
+        return result.scalar_one_or_none()
 
-        # Если пользователь существует - обновляем его
-        if user:
-            for key, value in kwargs.items():
-                setattr(user, key, value)
-            await self.session.commit()
+    def _loaded_user(self, main_id: int) -> Employee | None:
+        """Сотрудник из identity map сессии без запроса к БД.
+
+        Args:
+            main_id: Идентификатор сотрудника в БД
 
-        return user
+        Returns:
+            Объект Employee, если он уже загружен в сессию, иначе None
+        """
+        key = inspect(Employee).identity_key_from_primary_key((main_id,))
+        return self.session.identity_map.get(key)
 
     async def get_users_by_fio_parts(
         self, fullname: str, limit: int = 10
@@ -229,20 +658,16 @@ class EmployeeRepo(BaseRepo):
         Returns:
             Список объектов User или None
         """
-        name_parts = fullname.strip().split()
-        if not name_parts:
+        fio_filter = _fullname_filter(fullname)
+        if fio_filter is None:
             return []
 
-        # Создаём условия для каждой части имени
-        like_conditions = []
-        for part in name_parts:
-            like_conditions.append(Employee.fullname.ilike(f"%{part}%"))
-
         # Все части должны присутствовать в ФИО (AND)
-        query = select(Employee).where(and_(*like_conditions)).limit(limit)
+        predicate, params = fio_filter
+        query = select(Employee).where(predicate).limit(limit)
 
         try:
-            result = await self.session.execute(query)
+            result = await self.session.execute(query, params)
             return result.scalars().all()
         except SQLAlchemyError as e:
             logger.error(f"[БД] Ошибка получения пользователей по ФИО: {e}")
@@ -270,6 +695,7 @@ class EmployeeRepo(BaseRepo):
             return []
 
         conditions = []
+        params = {}
 
         # Проверяем, является ли запрос числом (User ID)
         if search_query.isdigit():
@@ -286,28 +712,26 @@ class EmployeeRepo(BaseRepo):
             # Всегда добавляем поиск по username
             conditions.append(Employee.username.ilike(f"%{search_query}%"))
 
-        # Поиск по частичному ФИО
-        name_parts = search_query.split()
-        if name_parts:
-            # Создаём условия для каждой части имени
-            name_conditions = []
-            for part in name_parts:
-                name_conditions.append(Employee.fullname.ilike(f"%{part}%"))
-
-            # Все части должны присутствовать в ФИО (AND)
-            if len(name_conditions) == 1:
-                conditions.append(name_conditions[0])
-            else:
-                conditions.append(and_(*name_conditions))
-
-        # Объединяем все условия через OR
+        # Поиск по частичному ФИО, все части должны присутствовать в ФИО (AND)
+        fio_filter = _fullname_filter(search_query)
+        if fio_filter is not None:
+            conditions.append(fio_filter[0])
+            params.update(fio_filter[1])
+
         if not conditions:
             return []
 
-        query = select(Employee).where(or_(*conditions)).limit(limit)
+        # Каждое условие - отдельный запрос со своим индексом, результаты
+        # объединяются через UNION: при OR MySQL не использует ни
+        # полнотекстовый индекс по ФИО, ни индекс по user_id
+        branches = [select(Employee).where(condition).limit(limit) for condition in conditions]
+        if len(branches) == 1:
+            query = branches[0]
+        else:
+            query = select(Employee).from_statement(union(*branches).limit(limit))
 
         try:
-            result = await self.session.execute(query)
+            result = await self.session.execute(query, params)
             return result.scalars().all()
         except SQLAlchemyError as e:
             logger.error(f"[БД] Ошибка универсального поиска пользователей: {e}")
@@ -318,6 +742,9 @@ class EmployeeRepo(BaseRepo):
     ) -> int:
         """Удаление сотрудников.
 
+        Ссылки на удаляемых сотрудников в event_logs, exchanges и
+        exchange_subscriptions обнуляются в той же транзакции.
+
         Args:
             main_id: Идентификатор сотрудника в БД
             fullname: ФИО сотрудника
@@ -341,21 +768,39 @@ class EmployeeRepo(BaseRepo):
             if user_id:
                 conditions.append(Employee.user_id == user_id)
 
-            # Находим пользователей по условиям
-            query = select(Employee).where(*conditions)
-            result = await self.session.execute(query)
-            users = result.scalars().all()
-
-            deleted_count = 0
-            for user in users:
-                await self.session.delete(user)
-                deleted_count += 1
-                logger.info(
-                    f"[БД] Пользователь {user.fullname} (ID: {user.user_id}) удален из базы"
+            # Имена удаляемых пользователей нужны только для лога, поэтому
+            # читаем их, только если он включен (в MySQL нет DELETE ... RETURNING)
+            users = []
+            async with self._tx():
+                if logger.isEnabledFor(logging.INFO):
+                    query = select(Employee.fullname, Employee.user_id).where(*conditions)
+                    users = (await self.session.execute(query)).all()
+
+                # Обнуляем ссылки на сотрудников, иначе DELETE нарушит
+                # внешние ключи (в том числе fk_event_logs_user). Удаляемые
+                # строки выбираются подзапросом, а не SELECT для лога выше
+                user_ids = select(Employee.user_id).where(*conditions)
+                for column in _EMPLOYEE_REFERENCES:
+                    await self.session.execute(
+                        update(column.table)
+                        .where(column.in_(user_ids))
+                        .values({column.key: None})
+                        .execution_options(synchronize_session=False)
+                    )
+
+                # Удаляем одним запросом вместо DELETE на каждую строку
+                result = await self.session.execute(
+                    delete(Employee)
+                    .where(*conditions)
+                    .execution_options(synchronize_session=False)
                 )
+            deleted_count = result.rowcount
 
             if deleted_count > 0:
-                await self.session.commit()
+                for user_fullname, user_tg_id in users:
+                    logger.info(
+                        f"[БД] Пользователь {user_fullname} (ID: {user_tg_id}) удален из базы"
+                    )
                 identifier = f"ФИО {fullname}" if fullname else f"user_id {user_id}"
                 logger.info(
                     f"[БД] Всего удалено {deleted_count} пользователей по {identifier}"
@@ -365,5 +810,4 @@ class EmployeeRepo(BaseRepo):
         except SQLAlchemyError as e:
             identifier = f"ФИО {fullname}" if fullname else f"user_id {user_id}"
             logger.error(f"[БД] Ошибка удаления пользователей по {identifier}: {e}")
-            await self.session.rollback()
             return 0
@@ -1,15 +1,57 @@
 """Репозиторий функций для взаимодействия с предметами."""
 
-from typing import List
+from typing import Hashable, Sequence
 
-from sqlalchemy import func, or_, select
+from sqlalchemy import Select, case, func, or_, select, update
+from sqlalchemy.ext.asyncio import AsyncSession
 
 from stp_database.models.STP import Product
+from stp_database.models.STP.product import ALL_DAYS_MASK, normalize_division
 from stp_database.repo.base import BaseRepo
+from stp_database.repo.cache import CatalogCache
 
 
 class ProductsRepo(BaseRepo):
-    """Репозиторий для работы с предметами."""
+    """Репозиторий для работы с предметами.
+
+    Attributes:
+        cache: Кеш справочника предметов (опционально)
+    """
+
+    def __init__(self, session, cache: CatalogCache | None = None):
+        """Инициализация репозитория.
+
+        Args:
+            session: Сессия SQLAlchemy
+            cache: Кеш справочника предметов (опционально). При изменении
+                предметов вызывающая сторона должна выполнить cache.bump()
+        """
+        super().__init__(session)
+        self.cache = cache
+
+    async def _fetch_products(
+        self, key: Hashable, select_stmt: Select[tuple[Product]]
+    ) -> Sequence[Product]:
+        """Выполнение запроса к предметам с использованием кеша.
+
+        Закешированные предметы загружаются в отдельной сессии кеша,
+        отсоединены от нее и доступны только для чтения.
+
+        Args:
+            key: Ключ запроса в кеше
+            select_stmt: Запрос к предметам
+
+        Returns:
+            Список предметов
+        """
+
+        async def load(session: AsyncSession) -> Sequence[Product]:
+            result = await session.execute(select_stmt)
+            return result.scalars().all()
+
+        if self.cache is None:
+            return await load(self.session)
+        return await self.cache.get_or_load(key, load)
 
     @staticmethod
     def _normalize_division(division: str | None) -> str | None:
@@ -23,15 +65,14 @@ class ProductsRepo(BaseRepo):
         Returns:
             Нормализованное подразделение
         """
-        if division and division.startswith("НТП"):
-            return "НТП"
-        return division
+        return normalize_division(division)
 
     async def get_products(
         self,
         division: str | None = None,
         role: int | None = None,
         only_active: bool = True,
+        activation_day: int | None = None,
     ):
         """Получение полного списка предметов.
 
@@ -39,6 +80,7 @@ class ProductsRepo(BaseRepo):
             division: Фильтр по подразделению (опционально)
             role: ID роли для фильтрации по buyer_roles (опционально)
             only_active: Фильтр только активных предметов
+            activation_day: День недели 1-7, в который должна быть доступна активация (опционально)
 
         Returns:
             Список предметов
@@ -61,11 +103,15 @@ class ProductsRepo(BaseRepo):
                 )
             )
 
+        if activation_day is not None:
+            conditions.append(
+                Product.activate_days_mask.op("&")(1 << (activation_day - 1)) != 0
+            )
+
         select_stmt = select(Product).where(*conditions)
-        result = await self.session.execute(select_stmt)
-        products = result.scalars().all()
+        key = ("products", normalized_division, role, only_active, activation_day)
 
-        return list(products)
+        return await self._fetch_products(key, select_stmt)
 
     async def get_product(self, product_id: int) -> Product | None:
         """Получение информации о предмете по его идентификатору.
@@ -74,16 +120,58 @@ class ProductsRepo(BaseRepo):
             product_id: Уникальный идентификатор предмета в таблице products
 
         Returns:
-            Объект Product
+            Объект Product или None, если предмет не найден
         """
-        select_stmt = select(Product).where(Product.id == product_id)
-        result = await self.session.execute(select_stmt)
+        return await self.session.get(Product, product_id)
+
+    async def backfill_activate_days_mask(self) -> int:
+        """Заполнение activate_days_mask по activate_days для всех предметов.
+
+        Выполняется один раз после добавления колонки activate_days_mask:
+        у существующих предметов маска вычисляется в БД одним UPDATE из JSON
+        activate_days. Для новых и измененных через ORM предметов маска
+        синхронизируется автоматически.
 
-        return result.scalar_one()
+        Returns:
+            Кол-во обновленных предметов
+        """
+        # Биты дней не пересекаются, поэтому маска собирается суммой
+        days_mask = sum(
+            case(
+                (
+                    func.json_contains(Product.activate_days, str(day)) == 1,
+                    1 << (day - 1),
+                ),
+                else_=0,
+            )
+            for day in range(1, 8)
+        )
+        stmt = (
+            update(Product)
+            .values(
+                activate_days_mask=case(
+                    (
+                        or_(
+                            Product.activate_days.is_(None),
+                            func.json_length(Product.activate_days) == 0,
+                        ),
+                        ALL_DAYS_MASK,
+                    ),
+                    else_=days_mask,
+                )
+            )
+            .execution_options(synchronize_session=False)
+        )
+
+        async with self._tx():
+            result = await self.session.execute(stmt)
+        if self.cache is not None:
+            await self._after_commit(self.cache.bump)
+        return result.rowcount
 
     async def get_available_products(
         self, user_balance: int, division: str, user_role: int | None = None
-    ) -> List[Product]:
+    ) -> Sequence[Product]:
         """Получение списка доступных предметов для пользователя.
 
         Возвращает предметы, стоимость которых меньше или равна балансу пользователя,
@@ -120,6 +208,4 @@ class ProductsRepo(BaseRepo):
         select_stmt = select(Product).where(*conditions)
 
         result = await self.session.execute(select_stmt)
-        products = result.scalars().all()
-
-        return list(products)
+        return result.scalars().all()
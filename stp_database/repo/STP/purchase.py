@@ -9,6 +9,7 @@ from sqlalchemy import desc, func, select
 from sqlalchemy.exc import SQLAlchemyError
 
 from stp_database.models.STP import Employee, Product
+from stp_database.models.STP.product import normalize_division
 from stp_database.models.STP.purchase import Purchase
 from stp_database.repo.base import BaseRepo
 
@@ -264,11 +265,16 @@ class PurchaseRepo(BaseRepo):
         # Для РГ role=2 дополнительно ограничиваем заявки division предмета.
         # То есть РГ НТП видит только предметы Product.division == "НТП",
         # РГ НЦК видит только предметы Product.division == "НЦК".
+        # Подразделения (НТП1, НТП2) приводятся к направлению предмета.
         if manager_role == 2 and division:
             if isinstance(division, list):
-                select_stmt = select_stmt.where(Product.division.in_(division))
+                select_stmt = select_stmt.where(
+                    Product.division.in_([normalize_division(d) for d in division])
+                )
             else:
-                select_stmt = select_stmt.where(Product.division == division)
+                select_stmt = select_stmt.where(
+                    Product.division == normalize_division(division)
+                )
 
         select_stmt = select_stmt.order_by(
             Purchase.bought_at.asc()
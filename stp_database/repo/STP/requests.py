@@ -1,9 +1,11 @@
 """Репозиторий для работы с моделями БД STP."""
 
 from dataclasses import dataclass
+from functools import cached_property
 
 from sqlalchemy.ext.asyncio import AsyncSession
 
+from stp_database.repo.cache import CatalogCache
 from stp_database.repo.STP.broadcast import BroadcastRepo
 from stp_database.repo.STP.employee import EmployeeRepo
 from stp_database.repo.STP.event_log import EventLogRepo
@@ -15,6 +17,7 @@ from stp_database.repo.STP.product import ProductsRepo
 from stp_database.repo.STP.purchase import PurchaseRepo
 from stp_database.repo.STP.transactions import TransactionRepo
 
+
 @dataclass
 class MainRequestsRepo:
     """Репозиторий для обработки операций с БД. Этот класс содержит все репозитории для моделей базы данных STP.
@@ -23,53 +26,54 @@ class MainRequestsRepo:
     """
 
     session: AsyncSession
+    product_cache: CatalogCache | None = None
 
-    @property
+    @cached_property
     def employee(self) -> EmployeeRepo:
         """Инициализация репозитория Employee с сессией для работы с записями сотрудников."""
         return EmployeeRepo(self.session)
 
-    @property
+    @cached_property
     def product(self) -> ProductsRepo:
         """Инициализация репозитория ProductsRepo с сессией для работы с предметами."""
-        return ProductsRepo(self.session)
+        return ProductsRepo(self.session, self.product_cache)
 
-    @property
+    @cached_property
     def purchase(self) -> PurchaseRepo:
         """Инициализация репозитория PurchaseRepo с сессией для работы с покупками."""
         return PurchaseRepo(self.session)
 
-    @property
+    @cached_property
     def transaction(self) -> TransactionRepo:
         """Инициализация репозитория TransactionRepo с сессией для работы с транзакциями."""
         return TransactionRepo(self.session)
 
-    @property
+    @cached_property
     def broadcast(self) -> BroadcastRepo:
         """Инициализация репозитория BroadcastRepo с сессией для работы с рассылками."""
         return BroadcastRepo(self.session)
 
-    @property
+    @cached_property
     def upload(self) -> FilesRepo:
         """Инициализация репозитория ScheduleLogRepo с сессией для работы с загрузкой файлов."""
         return FilesRepo(self.session)
 
-    @property
+    @cached_property
     def group(self) -> GroupRepo:
         """Инициализация репозитория GroupRepo с сессией для работы с управляемыми группами."""
         return GroupRepo(self.session)
 
-    @property
+    @cached_property
     def group_member(self) -> GroupMemberRepo:
         """Инициализация репозитория GroupMemberRepo с сессией для работы с участниками отслеживаемых групп."""
         return GroupMemberRepo(self.session)
 
-    @property
+    @cached_property
     def exchange(self) -> ExchangeRepo:
         """Инициализация репозитория ExchangeRepo с сессией для работы с биржей подменов."""
         return ExchangeRepo(self.session)
 
-    @property
+    @cached_property
     def event_log(self) -> EventLogRepo:
         """Инициализация репозитория EventLogRepo с сессией для работы с логами ивентов."""
         return EventLogRepo(self.session)
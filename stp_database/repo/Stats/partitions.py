@@ -0,0 +1,104 @@
+"""Управление помесячными секциями таблиц Stats."""
+
+import logging
+from abc import ABC, abstractmethod
+from datetime import date, timedelta
+
+from sqlalchemy import text
+from sqlalchemy.exc import SQLAlchemyError
+from sqlalchemy.ext.asyncio import AsyncSession
+
+logger = logging.getLogger(__name__)
+
+
+class MonthPartitionsMixin(ABC):
+    """Методы управления помесячными секциями таблицы.
+
+    Таблица секционирована по RANGE(TO_DAYS(extraction_period)) с последней
+    секцией p_max.
+
+    Репозиторий должен задавать partitioned_table (свойством или атрибутом
+    класса), иначе его экземпляр не создается.
+    """
+
+    session: AsyncSession
+
+    @property
+    @abstractmethod
+    def partitioned_table(self) -> str:
+        """Название секционированной таблицы."""
+
+    async def add_month_partition(self, month: date) -> None:
+        """Выделение секции под месяц из секции p_max.
+
+        Запускается ежемесячно заранее, до начала выгрузки данных за месяц.
+        Повторный вызов для уже существующей секции ничего не делает.
+
+        Args:
+            month: Любая дата месяца, под который создается секция
+        """
+        start = month.replace(day=1)
+        end = (start + timedelta(days=32)).replace(day=1)
+        table = self.partitioned_table
+
+        exists_query = text(
+            "SELECT 1 FROM information_schema.PARTITIONS "
+            "WHERE TABLE_SCHEMA = DATABASE() AND TABLE_NAME = :table "
+            "AND PARTITION_NAME = :partition"
+        )
+        stmt = text(
+            f"ALTER TABLE `{table}` REORGANIZE PARTITION p_max INTO ("
+            f"PARTITION p{start:%Y%m} VALUES LESS THAN (TO_DAYS('{end:%Y-%m-%d}')), "
+            "PARTITION p_max VALUES LESS THAN MAXVALUE)"
+        )
+
+        try:
+            result = await self.session.execute(
+                exists_query, {"table": table, "partition": f"p{start:%Y%m}"}
+            )
+            if result.scalar() is not None:
+                return
+
+            await self.session.execute(stmt)
+            logger.info(f"[БД] Создана секция p{start:%Y%m} в {table}")
+        except SQLAlchemyError as e:
+            logger.error(f"[БД] Ошибка создания секции p{start:%Y%m} в {table}: {e}")
+            raise
+
+    async def drop_partitions_before(self, month: date) -> int:
+        """Удаление секций с данными за месяцы до указанного.
+
+        Удаление секции выполняется за константное время, в отличие от
+        DELETE ... WHERE extraction_period < ...
+
+        Args:
+            month: Любая дата первого месяца, который нужно сохранить
+
+        Returns:
+            Кол-во удаленных секций
+        """
+        table = self.partitioned_table
+        boundary = f"p{month:%Y%m}"
+
+        query = text(
+            "SELECT PARTITION_NAME FROM information_schema.PARTITIONS "
+            "WHERE TABLE_SCHEMA = DATABASE() AND TABLE_NAME = :table "
+            "AND PARTITION_NAME <> 'p_max' AND PARTITION_NAME < :boundary"
+        )
+
+        try:
+            result = await self.session.execute(
+                query, {"table": table, "boundary": boundary}
+            )
+            partitions = result.scalars().all()
+            if not partitions:
+                return 0
+
+            await self.session.execute(
+                text(f"ALTER TABLE `{table}` DROP PARTITION {', '.join(partitions)}")
+            )
+            logger.info(f"[БД] Удалено {len(partitions)} секций из {table}")
+            return len(partitions)
+        except SQLAlchemyError as e:
+            logger.error(f"[БД] Ошибка удаления секций из {table}: {e}")
+            raise
@@ -1,23 +1,27 @@
 """Репозиторий для работы с Stats специалистов."""
 
 import logging
-from typing import Generic, Sequence, Type, TypeVar
+from typing import Any, Generic, Mapping, Sequence, Type, TypeVar
 
-from sqlalchemy import select
+from sqlalchemy import func, inspect, select
+from sqlalchemy.dialects.mysql import insert as mysql_insert
 from sqlalchemy.exc import SQLAlchemyError
+from sqlalchemy.ext.hybrid import hybrid_property
 
 from stp_database.models.Stats.spec_kpi import SpecKPI
 from stp_database.repo.base import BaseRepo
+from stp_database.repo.Stats.partitions import MonthPartitionsMixin
 
 logger = logging.getLogger(__name__)
 
 T = TypeVar("T", bound=SpecKPI)
 
 
-class SpecKPIRepo(BaseRepo, Generic[T]):
+class SpecKPIRepo(MonthPartitionsMixin, BaseRepo, Generic[T]):
     """Универсальный репозиторий для работы с Stats специалистов.
 
-    Работает с любой таблицей Stats (KpiDay, KpiWeek, KpiMonth) через один интерфейс.
+    Работает с показателями любого периода (день, неделя, месяц) через один интерфейс.
+    Все периоды хранятся в общей таблице kpi, поэтому секции таблицы общие.
 
     Attributes:
         model: Класс модели Stats (SpecDayKPI, SpecWeekKPI или SpecMonthKPI)
@@ -33,6 +37,11 @@ class SpecKPIRepo(BaseRepo, Generic[T]):
         super().__init__(session)
         self.model = model
 
+    @property
+    def partitioned_table(self) -> str:
+        """Название секционированной таблицы показателей."""
+        return self.model.__tablename__
+
     async def get_kpi(self, employee_ids: int | list[int]) -> T | None | Sequence[T]:
         """Поиск показателей специалистов в БД по ID сотрудника.
 
@@ -65,3 +74,88 @@ class SpecKPIRepo(BaseRepo, Generic[T]):
             )
             raise
             #return None if is_single else []
+
+    async def bulk_upsert(
+        self,
+        rows: Sequence[Mapping[str, Any]],
+        batch_size: int = 1000,
+    ) -> int:
+        """Массовая загрузка показателей через MySQL UPSERT.
+
+        Строки отправляются многострочными INSERT ... ON DUPLICATE KEY UPDATE
+        пачками по batch_size вместо вставки каждой строки через ORM.
+        Ключи детализирующих показателей (aht_chats_web и т.д.) собираются в metrics.
+        При обновлении существующей строки metrics объединяется с сохраненным
+        значением через JSON_MERGE_PATCH: ключи, не переданные в строке, сохраняются.
+        Колонка period заполняется периодом модели репозитория.
+        Все строки должны содержать одинаковый набор ключей.
+
+        Args:
+            rows: Строки показателей в виде словарей {атрибут модели: значение}
+            batch_size: Кол-во строк в одном INSERT
+
+        Returns:
+            Кол-во переданных строк
+
+        Raises:
+            ValueError: Если в строке передан неизвестный атрибут
+        """
+        if not rows:
+            return 0
+
+        table = self.model.__table__
+        period = inspect(self.model).polymorphic_identity
+        metric_keys = {
+            key
+            for key, attr in inspect(self.model).all_orm_descriptors.items()
+            if isinstance(attr, hybrid_property)
+        }
+
+        values = []
+        for row in rows:
+            invalid_keys = set(row) - set(table.c.keys()) - metric_keys
+            if invalid_keys:
+                raise ValueError(
+                    "Недопустимые поля показателей: " + ", ".join(sorted(invalid_keys))
+                )
+
+            value = {key: row[key] for key in row if key not in metric_keys}
+            if period is not None:
+                value["period"] = period
+            value["metrics"] = {
+                **(value.get("metrics") or {}),
+                **{key: row[key] for key in row if key in metric_keys},
+            }
+            values.append(value)
+
+        # updated_at заполняется значением по умолчанию и при обновлении строки
+        update_columns = {
+            key for key in values[0] if not table.c[key].primary_key
+        } | {"updated_at"}
+
+        try:
+            for start in range(0, len(values), batch_size):
+                insert_stmt = mysql_insert(self.model).values(
+                    values[start : start + batch_size]
+                )
+                update_values = {
+                    key: insert_stmt.inserted[key] for key in update_columns
+                }
+                update_values["metrics"] = func.json_merge_patch(
+                    func.coalesce(table.c.metrics, func.json_object()),
+                    insert_stmt.inserted.metrics,
+                )
+                upsert_stmt = insert_stmt.on_duplicate_key_update(update_values)
+                await self.session.execute(upsert_stmt)
+
+            await self.session.commit()
+            logger.info(
+                f"[БД] Загружено {len(values)} строк показателей в {self.model.__tablename__}"
+            )
+            return len(values)
+        except SQLAlchemyError as e:
+            await self.session.rollback()
+            logger.error(
+                f"[БД] Ошибка загрузки показателей в {self.model.__tablename__}: {e}"
+            )
+            raise
@@ -4,18 +4,22 @@ import logging
 from datetime import datetime
 from typing import Any, Sequence
 
-from sqlalchemy import select
+from sqlalchemy import delete, func, select
+from sqlalchemy.dialects.mysql import insert as mysql_insert
 from sqlalchemy.exc import SQLAlchemyError
 
-from stp_database.models.Stats.spec_premium import SpecPremium
+from stp_database.models.Stats.spec_premium import SpecPremium, SpecPremiumSummary
 from stp_database.repo.base import BaseRepo
+from stp_database.repo.Stats.partitions import MonthPartitionsMixin
 
 logger = logging.getLogger(__name__)
 
 
-class SpecPremiumRepo(BaseRepo):
+class SpecPremiumRepo(MonthPartitionsMixin, BaseRepo):
     """Репозиторий с функциями для работы с премией специалистов."""
 
+    partitioned_table = SpecPremium.__tablename__
+
     async def get_premium(
         self,
         employee_ids: int | list[int],
@@ -91,3 +95,73 @@ class SpecPremiumRepo(BaseRepo):
             await self.session.commit()
 
         return user
+
+    async def refresh_summary(self, extraction_period: datetime) -> None:
+        """Пересчет сводки премии за период.
+
+        Агрегаты считаются в БД одним INSERT ... SELECT ... GROUP BY
+        и сохраняются в SpecPremiumSummary. Вызывается после загрузки
+        премии за период. Прежняя сводка за период удаляется в той же
+        транзакции, поэтому если строк премии за период не осталось,
+        сводки за него тоже не будет.
+
+        Args:
+            extraction_period: Дата выгрузки премиума
+        """
+        aggregates = (
+            select(
+                SpecPremium.extraction_period,
+                func.count(),
+                func.sum(SpecPremium.contacts_count),
+                func.avg(SpecPremium.aht_premium),
+                func.avg(SpecPremium.csat_premium),
+                func.avg(SpecPremium.gok_premium),
+                func.avg(SpecPremium.total_premium),
+                func.now(),
+            )
+            .where(SpecPremium.extraction_period == extraction_period)
+            .group_by(SpecPremium.extraction_period)
+        )
+        columns = [
+            "extraction_period",
+            "employees_count",
+            "contacts_count",
+            "aht_premium",
+            "csat_premium",
+            "gok_premium",
+            "total_premium",
+            "updated_at",
+        ]
+
+        insert_stmt = mysql_insert(SpecPremiumSummary).from_select(columns, aggregates)
+        upsert_stmt = insert_stmt.on_duplicate_key_update(
+            {column: insert_stmt.inserted[column] for column in columns[1:]}
+        )
+
+        try:
+            await self.session.execute(
+                delete(SpecPremiumSummary).where(
+                    SpecPremiumSummary.extraction_period == extraction_period
+                )
+            )
+            await self.session.execute(upsert_stmt)
+            await self.session.commit()
+        except SQLAlchemyError as e:
+            await self.session.rollback()
+            logger.error(
+                f"[БД] Ошибка пересчета сводки премии специалистов за {extraction_period}: {e}"
+            )
+            raise
+
+    async def get_summary(
+        self, extraction_period: datetime
+    ) -> SpecPremiumSummary | None:
+        """Получение сводки премии за период.
+
+        Args:
+            extraction_period: Дата выгрузки премиума
+
+        Returns:
+            SpecPremiumSummary или None, если сводка за период не рассчитана
+        """
+        return await self.session.get(SpecPremiumSummary, extraction_period)
@@ -1,7 +1,15 @@
 """Базовый класс для репозиториев."""
 
+from contextlib import asynccontextmanager
+from typing import AsyncIterator, Awaitable, Callable
+
+from sqlalchemy.exc import SQLAlchemyError
 from sqlalchemy.ext.asyncio import AsyncSession
 
+# Ключи в session.info: глубина вложенности batch() и действия после его COMMIT
+_BATCH_DEPTH_KEY = "stp_batch_depth"
+_AFTER_COMMIT_KEY = "stp_after_commit"
+
 
 class BaseRepo:
     """Класс, представляющий базовый репозиторий для обработки операций с базой данных."""
@@ -15,3 +23,72 @@ class BaseRepo:
 
     async def __aexit__(self, exc_type, exc_val, exc_tb):
         await self.session.close()
+
+    @asynccontextmanager
+    async def batch(self) -> AsyncIterator[None]:
+        """Объединение нескольких изменений в одну транзакцию.
+
+        Изменяющие методы любых репозиториев этой сессии, вызванные внутри
+        блока, не делают собственный COMMIT: все изменения фиксируются одним
+        COMMIT при выходе из блока или откатываются при исключении.
+
+        Example:
+            async with repo.employee.batch():
+                await repo.employee.update_user(main_id=1, role=2)
+                await repo.employee.delete_user(user_id=42)
+        """
+        info = self.session.info
+        depth = info.get(_BATCH_DEPTH_KEY, 0)
+        info[_BATCH_DEPTH_KEY] = depth + 1
+        try:
+            yield
+            if depth == 0:
+                await self.session.commit()
+        except BaseException:
+            if depth == 0:
+                info.pop(_AFTER_COMMIT_KEY, None)
+                await self.session.rollback()
+            raise
+        finally:
+            info[_BATCH_DEPTH_KEY] = depth
+
+        if depth == 0:
+            for callback in info.pop(_AFTER_COMMIT_KEY, ()):
+                await callback()
+
+    @asynccontextmanager
+    async def _tx(self) -> AsyncIterator[None]:
+        """Транзакция изменяющего метода репозитория.
+
+        Вне batch() фиксирует изменения при успехе и откатывает при ошибке
+        SQLAlchemy. Внутри batch() выполняет блок в SAVEPOINT: ошибка
+        откатывает только этот блок, а COMMIT остается за batch().
+
+        Raises:
+            SQLAlchemyError: Ошибка выполнения блока (после отката)
+        """
+        if self.session.info.get(_BATCH_DEPTH_KEY):
+            async with self.session.begin_nested():
+                yield
+            return
+
+        try:
+            yield
+            await self.session.commit()
+        except SQLAlchemyError:
+            await self.session.rollback()
+            raise
+
+    async def _after_commit(self, callback: Callable[[], Awaitable[None]]) -> None:
+        """Выполнение действия после фиксации изменений.
+
+        Вне batch() действие выполняется сразу (вызывается после _tx()),
+        внутри batch() - после его COMMIT и только если он прошел успешно.
+
+        Args:
+            callback: Корутина-функция, например инвалидация кеша
+        """
+        if self.session.info.get(_BATCH_DEPTH_KEY):
+            self.session.info.setdefault(_AFTER_COMMIT_KEY, []).append(callback)
+        else:
+            await callback()
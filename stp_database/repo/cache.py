@@ -0,0 +1,109 @@
+"""Кеш редко изменяемых справочников."""
+
+import time
+from typing import TYPE_CHECKING, Any, Awaitable, Callable, Hashable, TypeVar
+
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
+
+if TYPE_CHECKING:
+    from redis.asyncio import Redis
+
+T = TypeVar("T")
+
+
+class CatalogCache:
+    """Процессный кеш справочника с инвалидацией через счетчик версии в Redis.
+
+    Результаты запросов хранятся в памяти процесса вместе с версией справочника,
+    при которой они были загружены. Любое изменение справочника увеличивает
+    версию в Redis (INCR), после чего все процессы перечитывают данные из БД.
+
+    Данные загружаются в отдельной сессии из session_pool, поэтому кешированные
+    объекты отсоединены и не пересекаются с объектами сессии вызывающей стороны.
+    Версия справочника запрашивается из Redis не чаще раза в version_ttl секунд.
+
+    Объект кеша создается один раз при старте приложения и передается
+    в агрегаторы репозиториев.
+
+    Attributes:
+        redis: Асинхронный клиент Redis
+        session_pool: Фабрика сессий для загрузки справочника
+        namespace: Название справочника, используется в ключе версии
+        version_ttl: Время в секундах, в течение которого версия не перечитывается из Redis
+    """
+
+    def __init__(
+        self,
+        redis: "Redis",
+        session_pool: async_sessionmaker[AsyncSession],
+        namespace: str,
+        version_ttl: float = 1,
+    ):
+        """Инициализация кеша.
+
+        Args:
+            redis: Асинхронный клиент Redis
+            session_pool: Фабрика сессий для загрузки справочника
+            namespace: Название справочника (например, "products")
+            version_ttl: Время в секундах, в течение которого версия справочника
+                не перечитывается из Redis (по умолчанию 1, 0 - перечитывать всегда)
+        """
+        self.redis = redis
+        self.session_pool = session_pool
+        self.namespace = namespace
+        self.version_ttl = version_ttl
+        self._entries: dict[Hashable, tuple[int, Any]] = {}
+        self._version: tuple[float, int] | None = None
+
+    @property
+    def _version_key(self) -> str:
+        return f"{self.namespace}:v"
+
+    async def version(self) -> int:
+        """Получение текущей версии справочника.
+
+        Returns:
+            Номер версии (0, если справочник ни разу не изменялся)
+        """
+        version = await self.redis.get(self._version_key)
+        return int(version or 0)
+
+    async def _current_version(self) -> int:
+        if self._version is not None and self._version[0] > time.monotonic():
+            return self._version[1]
+
+        version = await self.version()
+        self._version = (time.monotonic() + self.version_ttl, version)
+        return version
+
+    async def bump(self) -> None:
+        """Увеличение версии справочника, инвалидирующее кеш во всех процессах.
+
+        В текущем процессе новая версия действует сразу, в остальных -
+        не позднее чем через version_ttl секунд.
+        """
+        version = await self.redis.incr(self._version_key)
+        self._version = (time.monotonic() + self.version_ttl, int(version))
+
+    async def get_or_load(
+        self, key: Hashable, loader: Callable[[AsyncSession], Awaitable[T]]
+    ) -> T:
+        """Получение значения из кеша или загрузка его из БД.
+
+        Args:
+            key: Ключ запроса (например, кортеж параметров фильтрации)
+            loader: Корутина-функция, загружающая значение из БД в переданной сессии
+
+        Returns:
+            Значение, актуальное для текущей версии справочника
+        """
+        version = await self._current_version()
+
+        entry = self._entries.get(key)
+        if entry is not None and entry[0] == version:
+            return entry[1]
+
+        async with self.session_pool() as session:
+            value = await loader(session)
+        self._entries[key] = (version, value)
+        return value
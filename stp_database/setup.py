@@ -1,5 +1,8 @@
 """Создание движков и сессий."""
 
+import json
+from functools import partial
+
 from sqlalchemy import URL
 from sqlalchemy.ext.asyncio import (
     AsyncEngine,
@@ -8,6 +11,10 @@ from sqlalchemy.ext.asyncio import (
     create_async_engine,
 )
 
+# Сериализация JSON колонок без пробелов и без экранирования кириллицы
+# в \uXXXX: меньше байт на запись и меньше работы json.dumps
+_json_serializer = partial(json.dumps, ensure_ascii=False, separators=(",", ":"))
+
 
 def create_engine(
     db_name: str,
@@ -17,6 +24,7 @@ def create_engine(
     password: str = "",
     driver: str = "aiomysql",
     echo: bool = False,
+    query_cache_size: int = 1200,
 ) -> AsyncEngine:
     """Создает асинхронный движок SQLAlchemy для подключения к базе данных.
 
@@ -28,6 +36,7 @@ def create_engine(
         password (str, optional): Пароль пользователя. По умолчанию "".
         driver (str, optional): Драйвер для подключения. По умолчанию "aiomysql".
         echo (bool, optional): Включить логирование SQL-запросов. По умолчанию False.
+        query_cache_size (int, optional): Размер LRU кеша скомпилированных SQL-запросов. По умолчанию 1200.
 
     Returns:
         AsyncEngine: Асинхронный движок SQLAlchemy с настроенным пулом соединений.
@@ -51,6 +60,8 @@ def create_engine(
         pool_timeout=15,
         pool_pre_ping=True,
         pool_recycle=1800,
+        query_cache_size=query_cache_size,
+        json_serializer=_json_serializer,
         connect_args={
             "charset": "utf8mb4",
             "connect_timeout": 10,
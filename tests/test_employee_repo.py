@@ -0,0 +1,106 @@
+"""Тесты репозитория сотрудников."""
+
+import asyncio
+import logging
+
+import pytest
+from sqlalchemy import event, text
+
+pytest.importorskip("aiosqlite")
+
+from sqlalchemy.ext.asyncio import async_sessionmaker, create_async_engine  # noqa: E402
+
+from stp_database.repo.STP.employee import EmployeeRepo  # noqa: E402
+
+# Минимальная схема таблиц, участвующих в удалении сотрудника
+_SCHEMA = (
+    "CREATE TABLE employees (id INTEGER PRIMARY KEY, user_id BIGINT UNIQUE, "
+    "fullname VARCHAR(128) NOT NULL)",
+    "CREATE TABLE event_logs (id INTEGER PRIMARY KEY, "
+    "user_id BIGINT REFERENCES employees (user_id), event_type VARCHAR(50))",
+    "CREATE TABLE exchanges (id INTEGER PRIMARY KEY, "
+    "owner_id BIGINT REFERENCES employees (user_id), "
+    "counterpart_id BIGINT REFERENCES employees (user_id), updated_at TIMESTAMP)",
+    "CREATE TABLE exchange_subscriptions (id INTEGER PRIMARY KEY, "
+    "subscriber_id BIGINT REFERENCES employees (user_id), "
+    "target_seller_id BIGINT REFERENCES employees (user_id), updated_at TIMESTAMP)",
+)
+
+
+async def _delete_employee_with_references() -> tuple[int, list, list, list]:
+    engine = create_async_engine("sqlite+aiosqlite://")
+
+    @event.listens_for(engine.sync_engine, "connect")
+    def _enable_foreign_keys(dbapi_connection, _):
+        dbapi_connection.execute("PRAGMA foreign_keys = ON")
+
+    async with engine.begin() as conn:
+        for statement in _SCHEMA:
+            await conn.execute(text(statement))
+        await conn.execute(
+            text(
+                "INSERT INTO employees (id, user_id, fullname) "
+                "VALUES (1, 42, 'Иванов Иван'), (2, 43, 'Петров Петр')"
+            )
+        )
+        await conn.execute(
+            text(
+                "INSERT INTO event_logs (user_id, event_type) "
+                "VALUES (42, 'click'), (43, 'click')"
+            )
+        )
+        await conn.execute(
+            text("INSERT INTO exchanges (owner_id, counterpart_id) VALUES (43, 42)")
+        )
+        await conn.execute(
+            text(
+                "INSERT INTO exchange_subscriptions (subscriber_id, target_seller_id) "
+                "VALUES (43, 42)"
+            )
+        )
+
+    try:
+        async with async_sessionmaker(engine, expire_on_commit=False)() as session:
+            deleted = await EmployeeRepo(session).delete_user(user_id=42)
+
+            event_logs = (
+                await session.execute(
+                    text("SELECT user_id FROM event_logs ORDER BY id")
+                )
+            ).all()
+            exchanges = (
+                await session.execute(
+                    text("SELECT owner_id, counterpart_id FROM exchanges")
+                )
+            ).all()
+            subscriptions = (
+                await session.execute(
+                    text(
+                        "SELECT subscriber_id, target_seller_id FROM exchange_subscriptions"
+                    )
+                )
+            ).all()
+    finally:
+        await engine.dispose()
+
+    return deleted, event_logs, exchanges, subscriptions
+
+
+@pytest.mark.parametrize("log_level", [logging.WARNING, logging.INFO])
+def test_delete_user_with_event_logs(caplog, log_level):
+    """Удаление сотрудника с логами событий обнуляет ссылки на него.
+
+    Проверяется как без SELECT удаляемых строк для лога, так и с ним.
+    """
+    caplog.set_level(log_level, logger="stp_database.repo.STP.employee")
+    deleted, event_logs, exchanges, subscriptions = asyncio.run(
+        _delete_employee_with_references()
+    )
+
+    assert deleted == 1
+    assert event_logs == [(None,), (43,)]
+    assert exchanges == [(43, None)]
+    assert subscriptions == [(43, None)]
+
+    if log_level == logging.INFO:
+        assert "Пользователь Иванов Иван (ID: 42) удален из базы" in caplog.text